@@ -11,8 +11,9 @@ export function useRecipeSearch() {
     if (!query.trim()) { setResults([]); return; }
     timer.current = setTimeout(async () => {
       try {
-        const data = await api.get(`/search/recipes?q=${encodeURIComponent(query)}`);
-        setResults(data.slice(0, 8));
+        // Autocomplete endpoint answers from an in-memory index — cheap per keystroke
+        const data = await api.get(`/search/suggest?q=${encodeURIComponent(query)}&types=recipe&limit=8`);
+        setResults(data.map(s => ({ id: s.id, title: s.label, user: { display_name: s.author } })));
       } catch { /* ignore */ }
     }, 300);
     return () => clearTimeout(timer.current);
@@ -16,7 +16,7 @@ describe('useRecipeSearch', () => {
     fetch.mockResolvedValue({
       ok: true,
       status: 200,
-      json: async () => ({ data: [{ id: 1, title: 'Pasta' }], message: 'Success' }),
+      json: async () => ({ data: [{ type: 'recipe', id: 1, label: 'Pasta', author: 'Rob', weight: 3 }], message: 'Success' }),
     })
 
     const { result } = renderHook(() => useRecipeSearch())
@@ -52,7 +52,7 @@ describe('useRecipeSearch', () => {
     fetch.mockResolvedValueOnce({
       ok: true,
       status: 200,
-      json: async () => ({ data: [{ id: 1, title: 'Pasta' }], message: 'Success' }),
+      json: async () => ({ data: [{ type: 'recipe', id: 1, label: 'Pasta', author: 'Rob', weight: 3 }], message: 'Success' }),
     })
 
     const { result } = renderHook(() => useRecipeSearch())
@@ -69,6 +69,6 @@ describe('useRecipeSearch', () => {
 
     expect(fetch).toHaveBeenCalledTimes(1)
     const [url] = fetch.mock.calls[0]
-    expect(url).toContain('/search/recipes?q=pasta')
+    expect(url).toContain('/search/suggest?q=pasta')
   })
 })
@@ -11,18 +11,25 @@ const SORT_OPTIONS = [
   { value: 'most_cooked', label: 'Most Cooked' },
 ];
 
+const WINDOW_OPTIONS = [
+  { value: 7, label: 'Last 7 days' },
+  { value: 30, label: 'Last 30 days' },
+  { value: 365, label: 'Last year' },
+];
+
 export default function ExplorePage() {
   const { user } = useAuth();
   const [posts, setPosts] = useState([]);
   const [sort, setSort] = useState('recent');
+  const [timeWindow, setTimeWindow] = useState(30);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
 
-  async function load(sortValue) {
+  async function load(sortValue, windowValue) {
     setLoading(true);
     setError(null);
     try {
-      const data = await api.get(`/explore?sort=${sortValue}`);
+      const data = await api.get(`/explore?sort=${sortValue}&window=${windowValue}`);
       setPosts(data.posts ?? []);
     } catch (err) {
       setError(err.message || 'Failed to load explore page.');
@@ -32,12 +39,12 @@ export default function ExplorePage() {
   }
 
   useEffect(() => {
-    load(sort);
-  }, [sort]);
+    load(sort, timeWindow);
+  }, [sort, timeWindow]);
 
   const subtitle = sort === 'recent'
     ? 'Discover the latest recipes from the CookBook community.'
-    : `Discover what the CookBook community is ${sort === 'most_saved' ? 'saving' : 'cooking'} — last 30 days.`;
+    : `Discover what the CookBook community is ${sort === 'most_saved' ? 'saving' : 'cooking'} — ${WINDOW_OPTIONS.find((w) => w.value === timeWindow).label.toLowerCase()}.`;
 
   return (
     <div className="max-w-6xl mx-auto px-4 py-8">
@@ -60,6 +67,18 @@ export default function ExplorePage() {
             <option key={opt.value} value={opt.value}>{opt.label}</option>
           ))}
         </select>
+        {sort !== 'recent' && (
+          <select
+            aria-label="Time window"
+            value={timeWindow}
+            onChange={(e) => setTimeWindow(Number(e.target.value))}
+            className="border border-border rounded px-3 py-1.5 text-sm bg-surface-input text-text focus:outline-none focus:ring-2 focus:ring-cta"
+          >
+            {WINDOW_OPTIONS.map((opt) => (
+              <option key={opt.value} value={opt.value}>{opt.label}</option>
+            ))}
+          </select>
+        )}
       </div>
 
       {loading ? (
@@ -68,7 +87,7 @@ export default function ExplorePage() {
         <div className="py-16 text-center">
           <p className="text-text-muted mb-3">{error}</p>
           <button
-            onClick={() => load(sort)}
+            onClick={() => load(sort, timeWindow)}
             className="text-sm text-accent hover:underline"
           >
             Try again
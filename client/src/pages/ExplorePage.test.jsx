@@ -1,5 +1,5 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest'
-import { render, screen, waitFor } from '@testing-library/react'
+import { render, screen, waitFor, fireEvent } from '@testing-library/react'
 import { MemoryRouter } from 'react-router-dom'
 import ExplorePage from './ExplorePage'
 
@@ -53,4 +53,16 @@ describe('ExplorePage', () => {
       expect(screen.getByText('Sign up to post')).toBeTruthy()
     })
   })
+
+  it('requests the chosen leaderboard window', async () => {
+    useAuth.mockReturnValue({ user: null })
+    renderExplorePage()
+
+    fireEvent.change(screen.getByLabelText('Sort by'), { target: { value: 'most_saved' } })
+    fireEvent.change(await screen.findByLabelText('Time window'), { target: { value: '7' } })
+
+    await waitFor(() => {
+      expect(api.get).toHaveBeenLastCalledWith('/explore?sort=most_saved&window=7')
+    })
+  })
 })
@@ -12,6 +12,8 @@ export default function RecipeBoxDetailPage() {
 
   const [box, setBox] = useState(null);
   const [posts, setPosts] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
 
@@ -35,10 +37,11 @@ export default function RecipeBoxDetailPage() {
       setLoading(true);
       setError('');
       try {
-        const data = await api.get(`/boxes/${id}`);
-        // Backend wraps as { box: {...}, posts: [...] }
+        const data = await api.get(`/boxes/${id}?cursor=`);
+        // Backend wraps as { box: {...}, posts: [...], next_cursor }
         setBox(data.box ?? data);
         setPosts(data.posts ?? data.entries ?? []);
+        setNextCursor(data.next_cursor ?? null);
       } catch (err) {
         setError(err.message ?? 'Could not load this box.');
       } finally {
@@ -48,6 +51,19 @@ export default function RecipeBoxDetailPage() {
     load();
   }, [id]);
 
+  async function handleLoadMore() {
+    setLoadingMore(true);
+    try {
+      const data = await api.get(`/boxes/${id}?cursor=${encodeURIComponent(nextCursor)}`);
+      setPosts((prev) => [...prev, ...(data.posts ?? [])]);
+      setNextCursor(data.next_cursor ?? null);
+    } catch (err) {
+      toast.error(err.message ?? 'Could not load more recipes.');
+    } finally {
+      setLoadingMore(false);
+    }
+  }
+
   function startEdit() {
     setEditName(box.name ?? '');
     setEditDesc(box.description ?? '');
@@ -279,6 +295,18 @@ export default function RecipeBoxDetailPage() {
         </div>
       )}
 
+      {nextCursor && (
+        <div className="flex justify-center mt-8">
+          <button
+            onClick={handleLoadMore}
+            disabled={loadingMore}
+            className="px-6 py-2 border border-border text-text-muted rounded-sm hover:border-cta hover:text-accent disabled:opacity-60 transition-colors text-sm font-medium"
+          >
+            {loadingMore ? 'Loading…' : 'Load more'}
+          </button>
+        </div>
+      )}
+
       {/* ── Cascade remove confirmation ── */}
       {removeTarget && (
         <div
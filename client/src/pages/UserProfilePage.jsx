@@ -145,7 +145,7 @@ export default function UserProfilePage() {
 
   const isOwn = currentUser && String(currentUser.id) === String(id);
 
-  // Load profile + check follow status
+  // Load profile (includes whether the current user follows it)
   useEffect(() => {
     async function load() {
       setLoading(true);
@@ -154,14 +154,7 @@ export default function UserProfilePage() {
         const p = await api.get(`/users/${id}`);
         setProfile(p);
         setFollowerCount(p.follower_count ?? 0);
-
-        // Check if current user follows this profile
-        if (currentUser && !isOwn) {
-          try {
-            const followers = await api.get(`/users/${id}/followers`);
-            setIsFollowing(followers.some(f => String(f.id) === String(currentUser.id)));
-          } catch { /* ignore */ }
-        }
+        setIsFollowing(Boolean(p.is_followed_by_me));
       } catch (err) {
         setError(err.message ?? 'Could not load profile.');
       } finally {
@@ -387,6 +380,13 @@ export default function UserProfilePage() {
                 to={`/boxes/${box.id}`}
                 className="p-4 bg-surface-raised border border-border rounded hover:border-cta/40 transition-all"
               >
+                {box.cover_images?.length > 0 && (
+                  <div className="grid grid-cols-4 gap-1 mb-3">
+                    {box.cover_images.map(src => (
+                      <img key={src} src={src} alt="" className="aspect-square w-full object-cover rounded" />
+                    ))}
+                  </div>
+                )}
                 <h3 className="font-semibold text-text">{box.name}</h3>
                 <p className="text-sm text-text-muted mt-1">{box.post_count ?? 0} recipes</p>
               </Link>
@@ -90,6 +90,25 @@ describe('UserProfilePage — boxes tab', () => {
     })
   })
 
+  it('shows box counts and cover images from the box list', async () => {
+    api.get
+      .mockResolvedValueOnce(mockProfile)
+      .mockResolvedValueOnce([])
+      .mockResolvedValueOnce([
+        { id: 10, name: 'Weeknight Dinners', post_count: 4, box_type: 'custom', cover_images: ['/a.jpg', '/b.jpg'] },
+      ])
+
+    const { container } = renderProfilePage()
+    await waitFor(() => expect(screen.getByText('Alice')).toBeTruthy())
+
+    fireEvent.click(screen.getByText('Recipe Boxes'))
+
+    await waitFor(() => {
+      expect(screen.getByText('4 recipes')).toBeTruthy()
+      expect(container.querySelectorAll('img[src="/a.jpg"], img[src="/b.jpg"]')).toHaveLength(2)
+    })
+  })
+
   it('shows empty state when no boxes', async () => {
     api.get
       .mockResolvedValueOnce(mockProfile)
@@ -158,3 +177,21 @@ describe('UserProfilePage — retry', () => {
     })
   })
 })
+
+describe('UserProfilePage — follow status', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    useAuth.mockReturnValue({ user: { id: 2, username: 'bob' } })
+  })
+
+  it('reads follow status from the profile without fetching followers', async () => {
+    api.get
+      .mockResolvedValueOnce({ ...mockProfile, is_followed_by_me: true }) // /users/1
+      .mockResolvedValueOnce([])                                          // /users/1/posts
+
+    renderProfilePage()
+
+    await waitFor(() => expect(screen.getByText('Following')).toBeTruthy())
+    expect(api.get).not.toHaveBeenCalledWith('/users/1/followers')
+  })
+})
@@ -36,7 +36,8 @@ def create_app():
     # Import models so Flask-Migrate can detect them for autogenerate
     from models import (  # noqa: F401
         user, post, recipe_post, ingredient, step,
-        tag, post_tag, recipe_box, box_post, comment, follow
+        tag, post_tag, recipe_box, box_post, comment, follow, timeline_entry,
+        ingredient_term, post_daily_stat, trending_rank, user_suggestion,
     )
 
     # Register blueprints
@@ -47,6 +48,7 @@ def create_app():
     from routes.comment_routes import comment_bp
     from routes.parse_routes import parse_bp
     from routes.search_routes import search_bp, explore_bp
+    from routes.export_routes import export_bp
 
     app.register_blueprint(auth_bp)
     app.register_blueprint(user_bp)
@@ -56,6 +58,11 @@ def create_app():
     app.register_blueprint(parse_bp)
     app.register_blueprint(search_bp)
     app.register_blueprint(explore_bp)
+    app.register_blueprint(export_bp)
+
+    # CLI maintenance commands (flask timeline ..., etc.)
+    from commands import register_commands
+    register_commands(app)
 
     return app
 
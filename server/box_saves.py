@@ -0,0 +1,71 @@
+"""
+Adding posts to and removing them from recipe boxes.
+
+Every save also lands in the saver's "liked" box, and removing a post from
+"liked" removes it from all of the user's boxes. Both rules are applied with
+one set-based statement over recipe_boxes for a whole batch of entries, so
+the number of queries depends neither on how many boxes the user has nor on
+how many entries change. The statements RETURN the box_posts rows they
+touched and the post counters are adjusted from those.
+"""
+from sqlalchemy import Integer, column, delete, or_, select, tuple_, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app import db
+from models.box_post import BoxPost
+from models.recipe_box import RecipeBox
+import counters
+
+
+def save(user_id, entries):
+    """
+    Add (box, post_id) entries, each post also to the user's liked box.
+    The boxes must belong to user_id. Rows that already exist are left alone.
+    Returns the set of (box_id, post_id) rows added.
+    """
+    if not entries:
+        return set()
+    box_types = {box.id: box.box_type for box, _ in entries}
+    requested = values(column("box_id", Integer), column("post_id", Integer), name="requested").data(
+        [(box.id, post_id) for box, post_id in entries]
+    )
+    rows = (
+        select(RecipeBox.id, requested.c.post_id)
+        .join(requested, or_(RecipeBox.id == requested.c.box_id, RecipeBox.box_type == "liked"))
+        .where(RecipeBox.user_id == user_id)
+        .distinct()
+    )
+    added = db.session.execute(
+        pg_insert(BoxPost)
+        .from_select(["box_id", "post_id"], rows)
+        .on_conflict_do_nothing(index_elements=["box_id", "post_id"])
+        .returning(BoxPost.box_id, BoxPost.post_id)
+    ).all()
+    # The only rows added outside the requested boxes are the liked-box copies
+    counters.bump_box_entries([(post_id, box_types.get(box_id, "liked")) for box_id, post_id in added], 1)
+    return {(box_id, post_id) for box_id, post_id in added}
+
+
+def unsave(user_id, entries):
+    """
+    Remove (box, post_id) entries. Removing a post from the liked box removes
+    it from every box user_id has. Returns the set of (box_id, post_id) rows
+    removed, cascaded ones included.
+    """
+    liked = [post_id for box, post_id in entries if box.box_type == "liked"]
+    other = [(box.id, post_id) for box, post_id in entries if box.box_type != "liked"]
+    matches = []
+    if liked:
+        matches.append(BoxPost.post_id.in_(liked))
+    if other:
+        matches.append(tuple_(BoxPost.box_id, BoxPost.post_id).in_(other))
+    if not matches:
+        return set()
+    removed = db.session.execute(
+        delete(BoxPost)
+        .where(BoxPost.box_id == RecipeBox.id, RecipeBox.user_id == user_id, or_(*matches))
+        .returning(BoxPost.box_id, BoxPost.post_id, RecipeBox.box_type)
+        .execution_options(synchronize_session=False)
+    ).all()
+    counters.bump_box_entries([(post_id, box_type) for _, post_id, box_type in removed], -1)
+    return {(box_id, post_id) for box_id, post_id, _ in removed}
@@ -0,0 +1,124 @@
+"""
+Flask CLI maintenance commands. Run from the server/ directory, e.g.:
+    FLASK_APP=app.py flask timeline rebuild
+"""
+import click
+from flask.cli import AppGroup
+from sqlalchemy import event
+
+from app import db
+
+timeline_cli = AppGroup("timeline", help="Home feed timeline maintenance.")
+search_cli = AppGroup("search", help="Recipe full-text search maintenance.")
+pantry_cli = AppGroup("pantry", help="Pantry ingredient matching maintenance.")
+trending_cli = AppGroup("trending", help="Explore leaderboard rollups.")
+counters_cli = AppGroup("counters", help="Post and user counter maintenance.")
+suggestions_cli = AppGroup("suggestions", help="Follow suggestion maintenance.")
+bench_cli = AppGroup("bench", help="Count SQL round trips for hot endpoints.")
+
+
+@timeline_cli.command("rebuild")
+def rebuild_timelines():
+    """Rebuild every user's timeline from follows + posts."""
+    import timeline
+
+    rows = timeline.rebuild_all()
+    db.session.commit()
+    click.echo(f"Rebuilt timelines: {rows} entries.")
+
+
+@search_cli.command("reindex")
+def reindex_search():
+    """Rebuild the full-text search document for every recipe."""
+    import search_index
+
+    search_index.reindex_all()
+    db.session.commit()
+    click.echo("Rebuilt recipe search documents.")
+
+
+@pantry_cli.command("reindex")
+def reindex_pantry():
+    """Re-normalize every recipe's ingredients into ingredient term ids."""
+    import pantry
+
+    recipes = pantry.reindex_all()
+    db.session.commit()
+    click.echo(f"Rebuilt ingredient terms for {recipes} recipes.")
+
+
+@trending_cli.command("refresh")
+@click.option("--full", is_flag=True, help="Re-roll every day's stats, not just the last few.")
+def refresh_trending(full):
+    """Roll box saves into daily stats and rebuild the Explore leaderboards."""
+    import trending
+
+    stats, ranks = trending.refresh(full=full)
+    db.session.commit()
+    click.echo(f"Refreshed trending: {stats} daily stat rows, {ranks} ranked posts.")
+
+
+@counters_cli.command("reconcile")
+def reconcile_counters():
+    """Recompute post and user counters from source rows."""
+    import counters
+
+    posts = counters.reconcile_posts()
+    users = counters.reconcile_users()
+    db.session.commit()
+    click.echo(f"Reconciled counters: {posts} posts, {users} users corrected.")
+
+
+@suggestions_cli.command("refresh")
+def refresh_suggestions():
+    """Recompute "who to follow" suggestions from follows and shared saves."""
+    import follow_suggestions
+
+    rows = follow_suggestions.refresh()
+    db.session.commit()
+    click.echo(f"Refreshed follow suggestions: {rows} rows.")
+
+
+def _count_queries(fn):
+    """Run fn() and return how many SQL statements it sent to the database."""
+    statements = []
+
+    def _record(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        fn()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+    return len(statements)
+
+
+@bench_cli.command("post-detail")
+@click.argument("post_id", type=int)
+def bench_post_detail(post_id):
+    """Round trips to serialize one post detail: lazy loading vs load_recipe_detail()."""
+    from loaders import load_recipe_detail
+    from models.recipe_post import RecipePost
+    from schemas.recipe_post_schema import recipe_post_detail_schema
+
+    if not db.session.get(RecipePost, post_id):
+        raise click.ClickException(f"Post {post_id} not found")
+
+    runs = (
+        ("lazy (db.session.get)", lambda: recipe_post_detail_schema.dump(db.session.get(RecipePost, post_id))),
+        ("load_recipe_detail", lambda: recipe_post_detail_schema.dump(load_recipe_detail(post_id))),
+    )
+    for label, fn in runs:
+        db.session.expunge_all()  # start each run from a cold identity map
+        click.echo(f"{label}: {_count_queries(fn)} queries")
+
+
+def register_commands(app):
+    app.cli.add_command(timeline_cli)
+    app.cli.add_command(search_cli)
+    app.cli.add_command(pantry_cli)
+    app.cli.add_command(trending_cli)
+    app.cli.add_command(counters_cli)
+    app.cli.add_command(suggestions_cli)
+    app.cli.add_command(bench_cli)
@@ -14,3 +14,10 @@ class Config:
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = "Lax"
     SESSION_COOKIE_SECURE = os.environ.get("FLASK_ENV") == "production"
+    # Posts by authors with more followers than this skip fan-out-on-write;
+    # they are merged into followers' feeds at read time instead (see timeline.py)
+    FEED_FANOUT_MAX_FOLLOWERS = int(os.environ.get("FEED_FANOUT_MAX_FOLLOWERS", 10000))
+    # Seconds between a worker's background rebuilds of its autocomplete index (see suggest_index.py)
+    SUGGEST_INDEX_TTL = int(os.environ.get("SUGGEST_INDEX_TTL", 600))
+    # Post detail responses each worker keeps in its in-memory LRU (see post_cache.py)
+    POST_CACHE_SIZE = int(os.environ.get("POST_CACHE_SIZE", 1024))
@@ -0,0 +1,121 @@
+"""
+Denormalized counters on posts and users.
+
+posts:
+  save_count    — entries in "liked" boxes (every save lands in the saver's liked box)
+  cook_count    — entries in "cooked" boxes
+  comment_count — comments and replies
+  fork_count    — recipes whose source_post_id points at the post
+users:
+  post_count, follower_count, following_count
+
+Each counter is changed with a relative UPDATE (col = col + n) in the same
+transaction as the row that changes it, so concurrent requests can't lose an
+increment. A post's updated_at is left alone — a save is not an edit.
+reconcile_posts() / reconcile_users() recompute every counter from the source
+tables to repair drift.
+"""
+from sqlalchemy import bindparam, func, or_, select, update
+
+from app import db
+from models.box_post import BoxPost
+from models.comment import Comment
+from models.follow import Follow
+from models.post import Post
+from models.recipe_box import RecipeBox
+from models.recipe_post import RecipePost
+from models.user import User
+
+# box_type -> the counter its entries feed
+BOX_COUNTERS = {"liked": "save_count", "cooked": "cook_count"}
+
+_posts = Post.__table__
+_users = User.__table__
+
+
+def _bump(table, row_id, deltas, **unchanged):
+    values = {name: table.c[name] + delta for name, delta in deltas.items() if delta}
+    if not row_id or not values:
+        return
+    db.session.execute(update(table).where(table.c.id == row_id).values(**values, **unchanged))
+
+
+def bump(post_id, **deltas):
+    """Add deltas to a post's counters, e.g. bump(7, save_count=1, cook_count=-1)."""
+    _bump(_posts, post_id, deltas, updated_at=_posts.c.updated_at)
+
+
+def bump_user(user_id, **deltas):
+    """Add deltas to a user's counters, e.g. bump_user(3, follower_count=1)."""
+    _bump(_users, user_id, deltas)
+
+
+def bump_box_entries(entries, delta):
+    """
+    Count box entries being added (delta=1) or removed (delta=-1). entries
+    are (post_id, box_type) pairs; each post's counters change in one UPDATE,
+    sent as a single batch.
+    """
+    per_post = {}
+    for post_id, box_type in entries:
+        counter = BOX_COUNTERS.get(box_type)
+        if counter:
+            deltas = per_post.setdefault(post_id, dict.fromkeys(BOX_COUNTERS.values(), 0))
+            deltas[counter] += delta
+    if not per_post:
+        return
+    db.session.execute(
+        update(_posts)
+        .where(_posts.c.id == bindparam("b_id"))
+        .values(
+            **{name: _posts.c[name] + bindparam(f"d_{name}") for name in BOX_COUNTERS.values()},
+            updated_at=_posts.c.updated_at,
+        ),
+        [
+            {"b_id": post_id, **{f"d_{name}": n for name, n in deltas.items()}}
+            for post_id, deltas in per_post.items()
+        ],
+    )
+
+
+def _count(table, *where):
+    return select(func.count()).select_from(table).where(*where).scalar_subquery()
+
+
+def _reconcile(table, actual, **unchanged):
+    result = db.session.execute(
+        update(table)
+        .where(or_(*(table.c[name] != value for name, value in actual.items())))
+        .values(**actual, **unchanged)
+    )
+    return result.rowcount
+
+
+def reconcile_posts():
+    """Recompute every post's counters from source rows. Returns the number of posts corrected."""
+    def box_entries(box_type):
+        return (
+            select(func.count())
+            .select_from(BoxPost)
+            .join(RecipeBox, RecipeBox.id == BoxPost.box_id)
+            .where(BoxPost.post_id == _posts.c.id, RecipeBox.box_type == box_type)
+            .scalar_subquery()
+        )
+
+    recipe_posts = RecipePost.__table__
+    return _reconcile(_posts, {
+        "save_count": box_entries("liked"),
+        "cook_count": box_entries("cooked"),
+        "comment_count": _count(Comment.__table__, Comment.post_id == _posts.c.id),
+        "fork_count": _count(recipe_posts, recipe_posts.c.source_post_id == _posts.c.id),
+    }, updated_at=_posts.c.updated_at)
+
+
+def reconcile_users():
+    """Recompute every user's counters from source rows. Returns the number of users corrected."""
+    follows = Follow.__table__
+    return _reconcile(_users, {
+        "post_count": _count(_posts, _posts.c.user_id == _users.c.id),
+        "follower_count": _count(follows, follows.c.followed_id == _users.c.id),
+        "following_count": _count(follows, follows.c.follower_id == _users.c.id),
+    })
@@ -0,0 +1,73 @@
+"""
+Fork / inspiration lineage of a recipe.
+
+A recipe points at the post it forks (source_post_id) and, optionally, the
+one that inspired it (inspo_post_id). walk() follows those links upward to
+the originals and downward to every recipe derived from the post, one level
+at a time. Each level is one query joining the previous level's posts to
+their neighbours: an index lookup on the primary key (up) or on
+ix_recipe_posts_source_post_id / _inspo_post_id (down).
+
+A level skips posts already found, so a post reachable by several paths is
+kept once, at its smallest depth, and a cycle ends the walk. Each level is
+also capped at the rows still needed (DISTINCT ON the post id, then LIMIT),
+so a heavily forked recipe costs at most limit + 1 rows per direction and
+the walk stops as soon as that many are found; max_depth bounds the number
+of levels.
+"""
+from sqlalchemy import case, or_, select
+from sqlalchemy.dialects.postgresql import distinct_on
+
+from app import db
+from models.recipe_post import RecipePost
+
+_recipe_posts = RecipePost.__table__
+
+
+def _level(frontier, seen, up, room):
+    """Up to room (post_id, via_id, relation) rows one step from frontier, skipping seen."""
+    near = _recipe_posts.alias("near")
+    node = _recipe_posts.alias("node")
+    if up:
+        link = node.c.id == near.c.source_post_id
+        on = or_(link, node.c.id == near.c.inspo_post_id)
+    else:
+        link = node.c.source_post_id == near.c.id
+        on = or_(link, node.c.inspo_post_id == near.c.id)
+    relation = case((link, "fork"), else_="inspo")
+    return (
+        select(node.c.id, near.c.id, relation)
+        .join_from(near, node, on)
+        .where(near.c.id.in_(frontier), node.c.id.not_in(seen))
+        .ext(distinct_on(node.c.id))
+        .order_by(node.c.id, near.c.id, relation)
+        .limit(room)
+    )
+
+
+def walk(post_id, max_depth, limit):
+    """
+    Ancestors and descendants of post_id, nearest first. Returns
+    {"ancestors": [...], "descendants": [...], "truncated": bool} where each
+    item is {post_id, via_id, relation, depth}: via_id is the neighbour it was
+    reached from (the derived post for ancestors, the original for
+    descendants), relation is "fork" or "inspo". A post reachable by several
+    paths is listed once, at its smallest depth.
+    """
+    result = {"ancestors": [], "descendants": [], "truncated": False}
+    for direction, up in (("ancestors", True), ("descendants", False)):
+        items = result[direction]
+        seen, frontier = {post_id}, [post_id]
+        for depth in range(1, max_depth + 1):
+            rows = db.session.execute(_level(frontier, seen, up, limit + 1 - len(items))).all()
+            for node_id, via_id, relation in rows:
+                seen.add(node_id)
+                items.append({"post_id": node_id, "via_id": via_id, "relation": relation, "depth": depth})
+            if len(items) > limit:
+                del items[limit:]
+                result["truncated"] = True
+                break
+            frontier = [node_id for node_id, _, _ in rows]
+            if not frontier:
+                break
+    return result
@@ -0,0 +1,116 @@
+"""
+Query helpers that eager-load exactly what each schema serializes, so list
+endpoints run a fixed number of queries no matter how many cards they return.
+"""
+from sqlalchemy import func, select, true
+from sqlalchemy.orm import joinedload, selectinload
+
+from app import db
+from models.box_post import BoxPost
+from models.comment import Comment
+from models.post import Post
+from models.post_tag import PostTag
+from models.recipe_box import RecipeBox
+from models.recipe_post import RecipePost
+
+BOX_COVERS = 4
+
+
+def recipe_list_query():
+    """
+    RecipePost query for anything dumped with RecipePostListSchema.
+    The card nests its author (UserBriefSchema), which would otherwise be
+    lazy-loaded with one SELECT per post.
+    """
+    return RecipePost.query.options(joinedload(RecipePost.user))
+
+
+def load_recipe_list(ids):
+    """Load list-shaped RecipePosts for ids, in the order given. Missing ids are skipped."""
+    if not ids:
+        return []
+    posts_map = {p.id: p for p in recipe_list_query().filter(RecipePost.id.in_(ids)).all()}
+    return [posts_map[pid] for pid in ids if pid in posts_map]
+
+
+def recipe_detail_query():
+    """
+    RecipePost query for RecipePostDetailSchema. Loads the whole graph in
+    three queries: the post joined with its author, tags and attribution posts
+    (plus their authors), then one SELECT each for ingredients and steps.
+    populate_existing refreshes posts already in the session, e.g. right
+    after an update.
+    """
+    return (
+        RecipePost.query
+        .options(
+            joinedload(RecipePost.user),
+            joinedload(RecipePost.tags).joinedload(PostTag.tag),
+            joinedload(RecipePost.source_post.of_type(RecipePost)).joinedload(Post.user),
+            joinedload(RecipePost.inspo_post.of_type(RecipePost)).joinedload(Post.user),
+            selectinload(RecipePost.ingredients),
+            selectinload(RecipePost.steps),
+        )
+        .execution_options(populate_existing=True)
+    )
+
+
+def load_recipe_detail(post_id):
+    """Return the detail-shaped RecipePost for post_id, or None."""
+    return recipe_detail_query().filter(RecipePost.id == post_id).one_or_none()
+
+
+def load_recipe_details(ids):
+    """Load detail-shaped RecipePosts for ids, in the order given. Missing ids are skipped."""
+    if not ids:
+        return []
+    posts_map = {p.id: p for p in recipe_detail_query().filter(RecipePost.id.in_(ids)).all()}
+    return [posts_map[pid] for pid in ids if pid in posts_map]
+
+
+def comment_thread_query():
+    """Comment query for CommentSchema: author, plus one level of replies and their authors."""
+    return Comment.query.options(
+        joinedload(Comment.user),
+        selectinload(Comment.replies).joinedload(Comment.user),
+    )
+
+
+def load_box_summaries(user_id):
+    """
+    A user's boxes with post_count, last_added_at and up to BOX_COVERS cover
+    image URLs each, newest save first, in one query. The covers come from a
+    LATERAL subquery per box that walks the (box_id, added_at, post_id) index
+    and stops after BOX_COVERS posts with an image.
+    Returns [(box, post_count, last_added_at, covers)] ordered by box id.
+    """
+    posts, recipe_posts = Post.__table__, RecipePost.__table__
+    in_box = BoxPost.box_id == RecipeBox.id
+    cover = func.coalesce(posts.c.image_url, recipe_posts.c.parsed_image_url)
+    covers = (
+        select(cover.label("image_url"), BoxPost.added_at, BoxPost.post_id)
+        .join(posts, posts.c.id == BoxPost.post_id)
+        .outerjoin(recipe_posts, recipe_posts.c.id == BoxPost.post_id)
+        .where(in_box, cover.isnot(None))
+        .order_by(BoxPost.added_at.desc(), BoxPost.post_id.desc())
+        .limit(BOX_COVERS)
+        .lateral("covers")
+    )
+    rows = db.session.execute(
+        select(
+            RecipeBox,
+            select(func.count()).select_from(BoxPost).where(in_box).scalar_subquery(),
+            select(func.max(BoxPost.added_at)).where(in_box).scalar_subquery(),
+            covers.c.image_url,
+        )
+        .outerjoin(covers, true())
+        .where(RecipeBox.user_id == user_id)
+        .order_by(RecipeBox.id, covers.c.added_at.desc(), covers.c.post_id.desc())
+    ).all()
+
+    summaries = {}
+    for box, post_count, last_added_at, image_url in rows:
+        summary = summaries.setdefault(box.id, (box, post_count, last_added_at, []))
+        if image_url:
+            summary[3].append(image_url)
+    return list(summaries.values())
@@ -0,0 +1,26 @@
+"""box posts keyset index
+
+Revision ID: 2a7f4d9c8e31
+Revises: 6e3c8a1f5d24
+Create Date: 2026-10-18 16:47:15.026871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2a7f4d9c8e31'
+down_revision = '6e3c8a1f5d24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('box_posts', schema=None) as batch_op:
+        batch_op.create_index('ix_box_posts_box_id_added_at_post_id', ['box_id', 'added_at', 'post_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('box_posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_box_posts_box_id_added_at_post_id')
@@ -0,0 +1,26 @@
+"""feed keyset index
+
+Revision ID: 3b9c1d7e2a10
+Revises: f0e7a8f122df
+Create Date: 2026-10-18 09:12:41.208113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b9c1d7e2a10'
+down_revision = 'f0e7a8f122df'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.create_index('ix_posts_user_id_created_at_id', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_posts_user_id_created_at_id')
@@ -0,0 +1,43 @@
+"""post engagement counters
+
+Revision ID: 4f1a8c2e6b90
+Revises: 9c4e1b7d3f58
+Create Date: 2026-10-18 14:52:19.604417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f1a8c2e6b90'
+down_revision = '9c4e1b7d3f58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('save_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('cook_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('fork_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill — same definitions as counters.reconcile()
+    op.execute("""
+        UPDATE posts p SET
+            save_count = (SELECT count(*) FROM box_posts bp JOIN recipe_boxes rb ON rb.id = bp.box_id
+                          WHERE bp.post_id = p.id AND rb.box_type = 'liked'),
+            cook_count = (SELECT count(*) FROM box_posts bp JOIN recipe_boxes rb ON rb.id = bp.box_id
+                          WHERE bp.post_id = p.id AND rb.box_type = 'cooked'),
+            comment_count = (SELECT count(*) FROM comments c WHERE c.post_id = p.id),
+            fork_count = (SELECT count(*) FROM recipe_posts rp WHERE rp.source_post_id = p.id)
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.drop_column('fork_count')
+        batch_op.drop_column('comment_count')
+        batch_op.drop_column('cook_count')
+        batch_op.drop_column('save_count')
@@ -0,0 +1,39 @@
+"""post fanned_out flag
+
+Revision ID: 5d8b3f1e9a72
+Revises: 7b5e2d9a4c16
+Create Date: 2026-10-18 18:26:07.214930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8b3f1e9a72'
+down_revision = '7b5e2d9a4c16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('fanned_out', sa.Boolean(), server_default=sa.true(), nullable=False))
+        batch_op.create_index(
+            'ix_posts_on_read_user_id_created_at_id', ['user_id', 'created_at', 'id'], unique=False,
+            postgresql_where=sa.text('NOT fanned_out'),
+        )
+
+    # Posts whose author has followers but that have no timeline rows were
+    # skipped on write; merging a post in on read is correct either way
+    op.execute("""
+        UPDATE posts p SET fanned_out = false
+        WHERE NOT EXISTS (SELECT 1 FROM timeline_entries te WHERE te.post_id = p.id)
+          AND EXISTS (SELECT 1 FROM follows f WHERE f.followed_id = p.user_id)
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_posts_on_read_user_id_created_at_id')
+        batch_op.drop_column('fanned_out')
@@ -0,0 +1,42 @@
+"""trigram search indexes
+
+Revision ID: 5e8f0b3c9a47
+Revises: c41a7e9b5d02
+Create Date: 2026-10-18 12:02:55.140386
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e8f0b3c9a47'
+down_revision = 'c41a7e9b5d02'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_username_trgm', ['username'], unique=False, postgresql_using='gin', postgresql_ops={'username': 'gin_trgm_ops'})
+        batch_op.create_index('ix_users_display_name_trgm', ['display_name'], unique=False, postgresql_using='gin', postgresql_ops={'display_name': 'gin_trgm_ops'})
+
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.create_index('ix_recipe_posts_title_trgm', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+
+    with op.batch_alter_table('ingredients', schema=None) as batch_op:
+        batch_op.create_index('ix_ingredients_name_trgm', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade():
+    with op.batch_alter_table('ingredients', schema=None) as batch_op:
+        batch_op.drop_index('ix_ingredients_name_trgm', postgresql_using='gin')
+
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_recipe_posts_title_trgm', postgresql_using='gin')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_display_name_trgm', postgresql_using='gin')
+        batch_op.drop_index('ix_users_username_trgm', postgresql_using='gin')
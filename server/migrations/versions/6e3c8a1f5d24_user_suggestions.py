@@ -0,0 +1,35 @@
+"""user suggestions
+
+Revision ID: 6e3c8a1f5d24
+Revises: d5a92e4b1f07
+Create Date: 2026-10-18 16:20:33.480129
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e3c8a1f5d24'
+down_revision = 'd5a92e4b1f07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_suggestions',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=False),
+    sa.Column('suggested_user_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('mutual_follows', sa.Integer(), nullable=False),
+    sa.Column('co_saves', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['suggested_user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'rank')
+    )
+    # Populated by `flask suggestions refresh`
+
+
+def downgrade():
+    op.drop_table('user_suggestions')
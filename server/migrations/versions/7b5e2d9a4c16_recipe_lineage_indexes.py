@@ -0,0 +1,28 @@
+"""recipe lineage indexes
+
+Revision ID: 7b5e2d9a4c16
+Revises: 2a7f4d9c8e31
+Create Date: 2026-10-18 17:02:41.558203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b5e2d9a4c16'
+down_revision = '2a7f4d9c8e31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.create_index('ix_recipe_posts_source_post_id', ['source_post_id'], unique=False)
+        batch_op.create_index('ix_recipe_posts_inspo_post_id', ['inspo_post_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_recipe_posts_inspo_post_id')
+        batch_op.drop_index('ix_recipe_posts_source_post_id')
@@ -0,0 +1,45 @@
+"""timeline entries
+
+Revision ID: 8d2e4f6a1c35
+Revises: 3b9c1d7e2a10
+Create Date: 2026-10-18 10:04:17.552901
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2e4f6a1c35'
+down_revision = '3b9c1d7e2a10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('timeline_entries',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'post_id')
+    )
+    with op.batch_alter_table('timeline_entries', schema=None) as batch_op:
+        batch_op.create_index('ix_timeline_entries_user_id_created_at_post_id', ['user_id', 'created_at', 'post_id'], unique=False)
+
+    # Backfill from existing follows. Authors over the fan-out limit can be
+    # trimmed afterwards with `flask timeline rebuild`.
+    op.execute(
+        "INSERT INTO timeline_entries (user_id, post_id, created_at) "
+        "SELECT f.follower_id, p.id, p.created_at "
+        "FROM follows f JOIN posts p ON p.user_id = f.followed_id "
+        "WHERE p.created_at IS NOT NULL"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('timeline_entries', schema=None) as batch_op:
+        batch_op.drop_index('ix_timeline_entries_user_id_created_at_post_id')
+
+    op.drop_table('timeline_entries')
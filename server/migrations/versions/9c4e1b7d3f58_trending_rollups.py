@@ -0,0 +1,57 @@
+"""trending rollups
+
+Revision ID: 9c4e1b7d3f58
+Revises: e2b6f9a41c73
+Create Date: 2026-10-18 14:05:47.331902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e1b7d3f58'
+down_revision = 'e2b6f9a41c73'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('post_daily_stats',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('save_count', sa.Integer(), nullable=False),
+    sa.Column('cook_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id', 'day')
+    )
+    with op.batch_alter_table('post_daily_stats', schema=None) as batch_op:
+        batch_op.create_index('ix_post_daily_stats_day', ['day'], unique=False)
+
+    op.create_table('trending_ranks',
+    sa.Column('window_days', sa.Integer(), nullable=False),
+    sa.Column('metric', sa.Enum('saves', 'cooks', name='trending_metric_enum'), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('window_days', 'metric', 'rank')
+    )
+
+    # Backfill the daily rollups; build the leaderboards with `flask trending refresh`
+    op.execute("""
+        INSERT INTO post_daily_stats (post_id, day, save_count, cook_count)
+        SELECT bp.post_id, date(bp.added_at), count(*),
+               count(*) FILTER (WHERE rb.box_type = 'cooked')
+        FROM box_posts bp JOIN recipe_boxes rb ON rb.id = bp.box_id
+        GROUP BY bp.post_id, date(bp.added_at)
+    """)
+
+
+def downgrade():
+    op.drop_table('trending_ranks')
+    sa.Enum(name='trending_metric_enum').drop(op.get_bind(), checkfirst=True)
+    with op.batch_alter_table('post_daily_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_post_daily_stats_day')
+
+    op.drop_table('post_daily_stats')
@@ -0,0 +1,36 @@
+"""faceted search indexes
+
+Revision ID: a7d3c5e8f214
+Revises: 5e8f0b3c9a47
+Create Date: 2026-10-18 12:48:30.662917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3c5e8f214'
+down_revision = '5e8f0b3c9a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.create_index('ix_recipe_posts_difficulty_cook_time', ['difficulty', 'cook_time_minutes'], unique=False)
+        batch_op.create_index('ix_recipe_posts_source_type_self_rating', ['source_type', 'self_rating'], unique=False)
+        batch_op.create_index('ix_recipe_posts_servings', ['servings'], unique=False)
+
+    with op.batch_alter_table('post_tags', schema=None) as batch_op:
+        batch_op.create_index('ix_post_tags_tag_id_post_id', ['tag_id', 'post_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('post_tags', schema=None) as batch_op:
+        batch_op.drop_index('ix_post_tags_tag_id_post_id')
+
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_recipe_posts_servings')
+        batch_op.drop_index('ix_recipe_posts_source_type_self_rating')
+        batch_op.drop_index('ix_recipe_posts_difficulty_cook_time')
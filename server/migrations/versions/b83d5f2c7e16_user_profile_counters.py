@@ -0,0 +1,38 @@
+"""user profile counters
+
+Revision ID: b83d5f2c7e16
+Revises: 4f1a8c2e6b90
+Create Date: 2026-10-18 15:21:40.172655
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b83d5f2c7e16'
+down_revision = '4f1a8c2e6b90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('post_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('follower_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('following_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill — same definitions as counters.reconcile_users()
+    op.execute("""
+        UPDATE users u SET
+            post_count = (SELECT count(*) FROM posts p WHERE p.user_id = u.id),
+            follower_count = (SELECT count(*) FROM follows f WHERE f.followed_id = u.id),
+            following_count = (SELECT count(*) FROM follows f WHERE f.follower_id = u.id)
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('following_count')
+        batch_op.drop_column('follower_count')
+        batch_op.drop_column('post_count')
@@ -0,0 +1,46 @@
+"""recipe search vector
+
+Revision ID: c41a7e9b5d02
+Revises: 8d2e4f6a1c35
+Create Date: 2026-10-18 11:26:03.917425
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'c41a7e9b5d02'
+down_revision = '8d2e4f6a1c35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+        batch_op.create_index('ix_recipe_posts_search_vector', ['search_vector'], unique=False, postgresql_using='gin')
+
+    # Backfill — same document as search_index._search_document()
+    op.execute("""
+        UPDATE recipe_posts rp SET search_vector =
+            setweight(to_tsvector('english', coalesce(rp.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce((
+                SELECT string_agg(t.name, ' ') FROM post_tags pt JOIN tags t ON t.id = pt.tag_id
+                WHERE pt.post_id = rp.id), '')), 'B') ||
+            setweight(to_tsvector('english', coalesce((
+                SELECT string_agg(i.name, ' ') FROM ingredients i
+                WHERE i.recipe_post_id = rp.id), '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(p.description, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce((
+                SELECT string_agg(s.body, ' ') FROM steps s
+                WHERE s.recipe_post_id = rp.id), '')), 'D')
+        FROM posts p
+        WHERE p.id = rp.id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_recipe_posts_search_vector', postgresql_using='gin')
+        batch_op.drop_column('search_vector')
@@ -0,0 +1,28 @@
+"""follows list indexes
+
+Revision ID: d5a92e4b1f07
+Revises: b83d5f2c7e16
+Create Date: 2026-10-18 15:48:02.915384
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a92e4b1f07'
+down_revision = 'b83d5f2c7e16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('follows', schema=None) as batch_op:
+        batch_op.create_index('ix_follows_followed_id_created_at', ['followed_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_follows_follower_id_created_at', ['follower_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('follows', schema=None) as batch_op:
+        batch_op.drop_index('ix_follows_follower_id_created_at')
+        batch_op.drop_index('ix_follows_followed_id_created_at')
@@ -0,0 +1,38 @@
+"""pantry ingredient terms
+
+Revision ID: e2b6f9a41c73
+Revises: a7d3c5e8f214
+Create Date: 2026-10-18 13:34:12.508261
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'e2b6f9a41c73'
+down_revision = 'a7d3c5e8f214'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ingredient_terms',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('ingredient_term_ids', postgresql.ARRAY(sa.Integer()), nullable=True))
+        batch_op.create_index('ix_recipe_posts_ingredient_term_ids', ['ingredient_term_ids'], unique=False, postgresql_using='gin')
+
+    # Term normalization lives in pantry.py; backfill with `flask pantry reindex`
+
+
+def downgrade():
+    with op.batch_alter_table('recipe_posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_recipe_posts_ingredient_term_ids', postgresql_using='gin')
+        batch_op.drop_column('ingredient_term_ids')
+
+    op.drop_table('ingredient_terms')
@@ -10,8 +10,15 @@ from models.recipe_box import RecipeBox
 from models.box_post import BoxPost
 from models.comment import Comment
 from models.follow import Follow
+from models.timeline_entry import TimelineEntry
+from models.ingredient_term import IngredientTerm
+from models.post_daily_stat import PostDailyStat
+from models.trending_rank import TrendingRank
+from models.user_suggestion import UserSuggestion
 
 __all__ = [
     "User", "Post", "RecipePost", "Ingredient", "Step",
     "Tag", "PostTag", "RecipeBox", "BoxPost", "Comment", "Follow",
+    "TimelineEntry", "IngredientTerm", "PostDailyStat", "TrendingRank",
+    "UserSuggestion",
 ]
@@ -9,5 +9,10 @@ class BoxPost(db.Model):
     post_id = db.Column(db.Integer, db.ForeignKey("posts.id"), primary_key=True)
     added_at = db.Column(db.DateTime, server_default=db.func.now())
 
+    __table_args__ = (
+        # Box contents page newest-first on (added_at, post_id)
+        db.Index("ix_box_posts_box_id_added_at_post_id", "box_id", "added_at", "post_id"),
+    )
+
     recipe_box = db.relationship("RecipeBox", back_populates="entries")
     post = db.relationship("Post", back_populates="box_entries")
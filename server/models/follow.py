@@ -8,5 +8,11 @@ class Follow(db.Model):
     followed_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
 
+    __table_args__ = (
+        # Followers / following lists page newest-first from either side
+        db.Index("ix_follows_followed_id_created_at", "followed_id", "created_at"),
+        db.Index("ix_follows_follower_id_created_at", "follower_id", "created_at"),
+    )
+
     follower = db.relationship("User", foreign_keys=[follower_id], back_populates="following")
     followed = db.relationship("User", foreign_keys=[followed_id], back_populates="followers")
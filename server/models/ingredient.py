@@ -11,4 +11,10 @@ class Ingredient(db.Model):
     unit = db.Column(db.String(50))
     sort_order = db.Column(db.Integer, nullable=False, default=0)
 
+    __table_args__ = (
+        # Trigram index (pg_trgm) for typo-tolerant ingredient search
+        db.Index("ix_ingredients_name_trgm", "name",
+                 postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
+
     recipe_post = db.relationship("RecipePost", back_populates="ingredients")
@@ -0,0 +1,13 @@
+from app import db
+
+
+class IngredientTerm(db.Model):
+    """
+    Normalized ingredient vocabulary for pantry matching: "2 Large Eggs, beaten"
+    and "egg" both map to the term "egg". recipe_posts.ingredient_term_ids
+    holds the term ids each recipe uses — see pantry.py.
+    """
+    __tablename__ = "ingredient_terms"
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), unique=True, nullable=False)
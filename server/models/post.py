@@ -17,10 +17,29 @@ class Post(db.Model):
     created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
+    # Engagement counters, maintained by counters.py
+    save_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    cook_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    comment_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    fork_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    # False when the author was over the fan-out limit at posting time, so the
+    # post has no timeline rows and is merged into feeds on read (timeline.py)
+    fanned_out = db.Column(db.Boolean, nullable=False, default=True, server_default=db.true())
+
     __mapper_args__ = {
         "polymorphic_on": post_type,
         "polymorphic_identity": "post",
     }
+    __table_args__ = (
+        # Serves the feed's keyset pagination: WHERE user_id IN (...) ORDER BY created_at, id
+        db.Index("ix_posts_user_id_created_at_id", "user_id", "created_at", "id"),
+        # The few posts feed_rows() merges in on read
+        db.Index(
+            "ix_posts_on_read_user_id_created_at_id", "user_id", "created_at", "id",
+            postgresql_where=db.text("NOT fanned_out"),
+        ),
+    )
 
     user = db.relationship("User", back_populates="posts")
     comments = db.relationship("Comment", back_populates="post", cascade="all, delete-orphan")
@@ -0,0 +1,20 @@
+from app import db
+
+
+class PostDailyStat(db.Model):
+    """
+    Daily rollup of box saves per post, keyed by the day the post was added to
+    a box. cook_count is the subset saved to a "cooked" box. Refreshed from
+    box_posts by `flask trending refresh` — see trending.py.
+    """
+    __tablename__ = "post_daily_stats"
+
+    post_id = db.Column(db.Integer, db.ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    save_count = db.Column(db.Integer, nullable=False, default=0)
+    cook_count = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Window sums scan a day range across all posts
+        db.Index("ix_post_daily_stats_day", "day"),
+    )
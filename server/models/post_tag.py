@@ -7,5 +7,10 @@ class PostTag(db.Model):
     post_id = db.Column(db.Integer, db.ForeignKey("posts.id"), primary_key=True)
     tag_id = db.Column(db.Integer, db.ForeignKey("tags.id"), primary_key=True)
 
+    __table_args__ = (
+        # The primary key leads with post_id; tag filters look up by tag_id
+        db.Index("ix_post_tags_tag_id_post_id", "tag_id", "post_id"),
+    )
+
     post = db.relationship("Post", back_populates="tags")
     tag = db.relationship("Tag", back_populates="post_tags")
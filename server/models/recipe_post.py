@@ -1,3 +1,6 @@
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred
+
 from app import db
 from models.post import Post
 
@@ -36,6 +39,8 @@ class RecipePost(Post):
     inspo_post_id = db.Column(db.Integer, db.ForeignKey("posts.id"))    # optional inspiration post
     inspo_user_id = db.Column(db.Integer, db.ForeignKey("users.id"))    # optional inspiration user
     parsed_image_url = db.Column(db.String(500))    # image scraped from external URL (may differ from post image_url)
+    search_vector = deferred(db.Column(TSVECTOR))   # full-text document, maintained by search_index.py
+    ingredient_term_ids = deferred(db.Column(ARRAY(db.Integer)))  # sorted ingredient_terms ids, maintained by pantry.py
 
     __mapper_args__ = {
         "polymorphic_identity": "recipe_post",
@@ -43,6 +48,19 @@ class RecipePost(Post):
         # confuse id with source_post_id / inspo_post_id
         "inherit_condition": id == Post.id,
     }
+    __table_args__ = (
+        db.Index("ix_recipe_posts_search_vector", "search_vector", postgresql_using="gin"),
+        db.Index("ix_recipe_posts_title_trgm", "title",
+                 postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        db.Index("ix_recipe_posts_ingredient_term_ids", "ingredient_term_ids", postgresql_using="gin"),
+        # Faceted search range / equality filters
+        db.Index("ix_recipe_posts_difficulty_cook_time", "difficulty", "cook_time_minutes"),
+        db.Index("ix_recipe_posts_source_type_self_rating", "source_type", "self_rating"),
+        db.Index("ix_recipe_posts_servings", "servings"),
+        # Fork / inspiration lineage walks and the reference cleanup in delete_post
+        db.Index("ix_recipe_posts_source_post_id", "source_post_id"),
+        db.Index("ix_recipe_posts_inspo_post_id", "inspo_post_id"),
+    )
 
     ingredients = db.relationship(
         "Ingredient", back_populates="recipe_post", cascade="all, delete-orphan", order_by="Ingredient.sort_order"
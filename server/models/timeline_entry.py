@@ -0,0 +1,20 @@
+from app import db
+
+
+class TimelineEntry(db.Model):
+    """
+    Materialized home feed: one row per (reader, post), written when a post is
+    created (fan-out-on-write) so the feed is a single index range scan.
+    Posts by authors with more than FEED_FANOUT_MAX_FOLLOWERS followers are
+    skipped on write (posts.fanned_out is false) and merged in on read
+    instead — see timeline.py.
+    """
+    __tablename__ = "timeline_entries"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    post_id = db.Column(db.Integer, db.ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    created_at = db.Column(db.DateTime, nullable=False)  # copy of posts.created_at, for ordering
+
+    __table_args__ = (
+        db.Index("ix_timeline_entries_user_id_created_at_post_id", "user_id", "created_at", "post_id"),
+    )
@@ -0,0 +1,16 @@
+from app import db
+
+
+class TrendingRank(db.Model):
+    """
+    Precomputed Explore leaderboards: the top posts per metric for each
+    trailing window (7 / 30 / 365 days), so Explore reads one short range
+    instead of aggregating box_posts per request. Rebuilt by trending.py.
+    """
+    __tablename__ = "trending_ranks"
+
+    window_days = db.Column(db.Integer, primary_key=True)
+    metric = db.Column(db.Enum("saves", "cooks", name="trending_metric_enum"), primary_key=True)
+    rank = db.Column(db.Integer, primary_key=True)
+    post_id = db.Column(db.Integer, db.ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
+    score = db.Column(db.Integer, nullable=False)
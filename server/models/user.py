@@ -15,6 +15,19 @@ class User(UserMixin, db.Model):
     password_hash = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
 
+    # Profile counters, maintained by counters.py
+    post_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    follower_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    following_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        # Trigram indexes (pg_trgm) serve ILIKE '%q%' and fuzzy user search
+        db.Index("ix_users_username_trgm", "username",
+                 postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}),
+        db.Index("ix_users_display_name_trgm", "display_name",
+                 postgresql_using="gin", postgresql_ops={"display_name": "gin_trgm_ops"}),
+    )
+
     posts = db.relationship("Post", back_populates="user", cascade="all, delete-orphan")
     comments = db.relationship("Comment", back_populates="user", cascade="all, delete-orphan")
     recipe_boxes = db.relationship("RecipeBox", back_populates="user", cascade="all, delete-orphan")
@@ -0,0 +1,17 @@
+from app import db
+
+
+class UserSuggestion(db.Model):
+    """
+    Precomputed "who to follow" list: the top-ranked candidates per user from
+    friends-of-friends and co-saved recipes, rebuilt by
+    `flask suggestions refresh` — see follow_suggestions.py.
+    """
+    __tablename__ = "user_suggestions"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    rank = db.Column(db.Integer, primary_key=True)
+    suggested_user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    score = db.Column(db.Float, nullable=False)
+    mutual_follows = db.Column(db.Integer, nullable=False, default=0)  # people you follow who follow them
+    co_saves = db.Column(db.Integer, nullable=False, default=0)        # recipes you've both saved
@@ -0,0 +1,169 @@
+"""
+Pantry matching: "what can I cook with what I have?"
+
+Ingredient names are normalized into a shared vocabulary (ingredient_terms),
+so "2 Large Eggs, beaten" and "egg" are the same term. Each recipe stores the
+sorted ids of the terms it uses in recipe_posts.ingredient_term_ids, an int[]
+with a GIN index. A pantry lookup is one `&&` (overlap) probe on that index to
+find every recipe sharing at least one ingredient; coverage is scored,
+filtered, ordered and paged in the same SQL statement, so only the page's
+rows come back, and a count(*) over the same filter gives the total.
+
+The arrays are rebuilt from the ingredient rows whenever a recipe is created
+or its ingredients are replaced; `flask pantry reindex` rebuilds them all.
+"""
+import re
+
+from sqlalchemy import Float, any_, bindparam, cast, func, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import array, insert as pg_insert
+
+from app import db
+from models.ingredient import Ingredient
+from models.ingredient_term import IngredientTerm
+from models.recipe_post import RecipePost
+
+_recipe_posts = RecipePost.__table__
+
+# Preparation and size words that don't change what the ingredient is
+_DESCRIPTORS = {
+    "fresh", "freshly", "chopped", "diced", "minced", "sliced", "grated", "shredded",
+    "crushed", "peeled", "ground", "dried", "frozen", "canned", "cooked", "raw",
+    "large", "medium", "small", "whole", "boneless", "skinless", "ripe", "organic",
+    "finely", "roughly", "thinly", "extra", "virgin", "unsalted", "salted",
+    "softened", "melted", "beaten", "room", "temperature", "optional", "of",
+}
+# Words the singularizer must leave alone
+_KEEP_S = {"asparagus", "couscous", "hummus", "molasses", "swiss", "bass", "grass", "watercress"}
+
+
+def _singular(word):
+    if word in _KEEP_S or len(word) <= 3:
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith(("oes", "ches", "shes", "sses", "xes")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def normalize(name):
+    """
+    Map a free-text ingredient name to its vocabulary term:
+    'Large Eggs, beaten' -> 'egg', 'Fresh Cherry Tomatoes (optional)' -> 'cherry tomato'.
+    Returns '' if nothing is left.
+    """
+    text = re.sub(r"\(.*?\)", " ", (name or "").lower()).split(",")[0]
+    words = [w for w in re.findall(r"[a-z]+", text) if w not in _DESCRIPTORS]
+    if not words:
+        return ""
+    words[-1] = _singular(words[-1])
+    return " ".join(words)
+
+
+def _term_ids(terms, create=False):
+    """Map normalized terms to ids, optionally adding unseen ones to the vocabulary."""
+    terms = {t for t in terms if t}
+    if not terms:
+        return {}
+    if create:
+        db.session.execute(
+            pg_insert(IngredientTerm)
+            .values([{"name": t} for t in sorted(terms)])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+    rows = db.session.execute(select(IngredientTerm.name, IngredientTerm.id).where(IngredientTerm.name.in_(terms)))
+    return dict(rows.all())
+
+
+def _reindex(*where):
+    db.session.flush()  # the arrays are built from ingredient rows pending in this session
+    rows = db.session.execute(
+        select(_recipe_posts.c.id, Ingredient.name)
+        .outerjoin(Ingredient, Ingredient.recipe_post_id == _recipe_posts.c.id)
+        .where(*where)
+    ).all()
+
+    terms_by_post = {}
+    for post_id, name in rows:
+        terms_by_post.setdefault(post_id, set()).add(normalize(name))
+    ids = _term_ids(set().union(*terms_by_post.values()) if terms_by_post else (), create=True)
+
+    params = [
+        {"b_id": post_id, "term_ids": sorted(ids[t] for t in terms if t)}
+        for post_id, terms in terms_by_post.items()
+    ]
+    if params:
+        db.session.execute(
+            update(_recipe_posts)
+            .where(_recipe_posts.c.id == bindparam("b_id"))
+            .values(ingredient_term_ids=bindparam("term_ids")),
+            params,
+        )
+    return len(params)
+
+
+def reindex_post(post_id):
+    """Rebuild one recipe's ingredient term array after its ingredients changed."""
+    _reindex(_recipe_posts.c.id == post_id)
+
+
+def reindex_all():
+    """Rebuild every recipe's ingredient term array. Returns the number of recipes."""
+    return _reindex()
+
+
+def match(ingredient_names, limit, offset=0, max_missing=None):
+    """
+    Rank recipes by how much of their ingredient list the pantry covers.
+    Returns (total, page) where page is [{post_id, coverage, have, missing}],
+    best first, with have / missing as term names. Recipes missing more than
+    max_missing terms are dropped.
+    """
+    pantry_ids = set(_term_ids(normalize(n) for n in ingredient_names).values())
+    if not pantry_ids:
+        return 0, []
+    pantry = array(sorted(pantry_ids))
+
+    term = func.unnest(_recipe_posts.c.ingredient_term_ids).table_valued("id").render_derived("term")
+    scored = (
+        select(
+            _recipe_posts.c.id,
+            _recipe_posts.c.ingredient_term_ids,
+            func.cardinality(_recipe_posts.c.ingredient_term_ids).label("terms"),
+            select(func.count()).select_from(term).where(term.c.id == any_(pantry))
+            .scalar_subquery().label("have"),
+        )
+        .where(_recipe_posts.c.ingredient_term_ids.overlap(pantry))
+        .subquery()
+    )
+    missing = scored.c.terms - scored.c.have
+    coverage = cast(scored.c.have, Float) / type_coerce(scored.c.terms, Float)
+    where = [missing <= max_missing] if max_missing is not None else []
+
+    total = db.session.scalar(select(func.count()).select_from(scored).where(*where))
+    if not total:
+        return 0, []
+    page = db.session.execute(
+        select(scored.c.id, scored.c.ingredient_term_ids, coverage)
+        .where(*where)
+        # Best coverage, then fewest missing, then newest
+        .order_by(coverage.desc(), missing, scored.c.id.desc())
+        .limit(limit)
+        .offset(offset)
+    ).all()
+
+    used_ids = {i for _, term_ids, _ in page for i in term_ids}
+    names = dict(db.session.execute(
+        select(IngredientTerm.id, IngredientTerm.name).where(IngredientTerm.id.in_(used_ids))
+    ).all()) if used_ids else {}
+    return total, [
+        {
+            "post_id": post_id,
+            "coverage": round(coverage, 3),
+            "have": sorted(names[i] for i in term_ids if i in pantry_ids),
+            "missing": sorted(names[i] for i in term_ids if i not in pantry_ids),
+        }
+        for post_id, term_ids, coverage in page
+    ]
@@ -0,0 +1,109 @@
+"""
+In-process LRU cache of serialized post detail responses.
+
+Entries are keyed by post id and stamped with a version: the post's
+updated_at and counters, its attribution ids and its author's public fields,
+plus the same updated_at, counters and author fields for the source and inspo
+posts nested in the detail as cards, read with one narrow SELECT per request.
+A cached dump is served only while that version still matches, so a worker
+never returns a detail another worker has since changed; the same version
+backs the ETag that lets browsers revalidate with a 304. There's no
+Last-Modified: counters and nested cards change without moving updated_at.
+update_post and delete_post also drop their entry directly so stale dumps
+don't hold memory.
+
+Each worker keeps up to POST_CACHE_SIZE entries and its own hit / miss
+counters, reported by stats().
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+from sqlalchemy import select
+
+from app import db
+from models.post import Post
+from models.recipe_post import RecipePost
+from models.user import User
+
+_lock = threading.Lock()
+_entries = OrderedDict()  # post_id -> (version, data), least recently used first
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def _card_columns(posts, users):
+    return (
+        posts.c.updated_at,
+        posts.c.save_count, posts.c.cook_count, posts.c.comment_count, posts.c.fork_count,
+        users.c.username, users.c.display_name, users.c.profile_image_url,
+    )
+
+
+def version(post_id):
+    """
+    The version stamp of a recipe post's detail, or None if there is no such
+    post.
+    """
+    recipe_posts = RecipePost.__table__
+    source, source_user = Post.__table__.alias("source"), User.__table__.alias("source_user")
+    inspo, inspo_user = Post.__table__.alias("inspo"), User.__table__.alias("inspo_user")
+    row = db.session.execute(
+        select(
+            Post.updated_at,
+            Post.save_count, Post.cook_count, Post.comment_count, Post.fork_count,
+            recipe_posts.c.source_post_id, recipe_posts.c.inspo_post_id,
+            User.username, User.display_name, User.profile_image_url,
+            *_card_columns(source, source_user),
+            *_card_columns(inspo, inspo_user),
+        )
+        .join(recipe_posts, recipe_posts.c.id == Post.id)
+        .join(User, User.id == Post.user_id)
+        .outerjoin(source, source.c.id == recipe_posts.c.source_post_id)
+        .outerjoin(source_user, source_user.c.id == source.c.user_id)
+        .outerjoin(inspo, inspo.c.id == recipe_posts.c.inspo_post_id)
+        .outerjoin(inspo_user, inspo_user.c.id == inspo.c.user_id)
+        .where(Post.id == post_id)
+    ).first()
+    return tuple(row) if row else None
+
+
+def etag(post_id, post_version):
+    return hashlib.sha1(repr((post_id, post_version)).encode("utf-8")).hexdigest()
+
+
+def get(post_id, post_version):
+    """The cached detail dump for this version of the post, or None."""
+    with _lock:
+        entry = _entries.get(post_id)
+        if entry and entry[0] == post_version:
+            _entries.move_to_end(post_id)
+            _stats["hits"] += 1
+            return entry[1]
+        _stats["misses"] += 1
+        return None
+
+
+def put(post_id, post_version, data):
+    with _lock:
+        _entries[post_id] = (post_version, data)
+        _entries.move_to_end(post_id)
+        while len(_entries) > current_app.config["POST_CACHE_SIZE"]:
+            _entries.popitem(last=False)
+
+
+def invalidate(post_id):
+    with _lock:
+        if _entries.pop(post_id, None):
+            _stats["invalidations"] += 1
+
+
+def stats():
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else None,
+            "size": len(_entries),
+            "max_size": current_app.config["POST_CACHE_SIZE"],
+        }
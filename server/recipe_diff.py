@@ -0,0 +1,93 @@
+"""
+Minimal updates for a recipe's ingredients, steps and tags.
+
+An edit sends the full lists. Instead of deleting and reinserting every row,
+incoming items are matched to existing rows, first by "id", then by position,
+and only differences are written: changed columns become UPDATEs, surplus
+items INSERTs and leftover rows DELETEs, which the ORM flush sends as batches.
+Unchanged rows keep their ids and aren't rewritten.
+
+Each sync_* returns the set of change kinds it made, so update_post can skip
+the search, pantry, suggestion and cache work an edit doesn't need:
+  "ingredients"       any ingredient row changed (quantities, order, ...)
+  "ingredient_names"  the ingredient names themselves changed
+  "steps"             any step row changed
+  "tags"              tags were added or removed
+"""
+from models.ingredient import Ingredient
+from models.post_tag import PostTag
+from models.step import Step
+
+
+def _sync(rows, incoming, values_for, model):
+    """
+    Make the rows of a collection match incoming dicts. values_for(item,
+    position) gives the column values a row should have. Returns True if
+    anything changed.
+    """
+    unmatched = {row.id: row for row in rows}
+    pairs, extra = [], []
+    for position, item in enumerate(incoming):
+        row = unmatched.pop(item.get("id"), None)
+        if row is None:
+            extra.append((position, item))
+        else:
+            pairs.append((row, values_for(item, position)))
+    # Items without a matching id take over the remaining rows in order
+    leftover = sorted(unmatched.values(), key=lambda row: (row.sort_order, row.id))
+    for row, (position, item) in zip(leftover, extra):
+        pairs.append((row, values_for(item, position)))
+    new_items = extra[len(leftover):]
+    stale_rows = leftover[len(extra):]
+
+    changed = bool(new_items or stale_rows)
+    for row, values in pairs:
+        for name, value in values.items():
+            if getattr(row, name) != value:
+                setattr(row, name, value)
+                changed = True
+    for position, item in new_items:
+        rows.append(model(**values_for(item, position)))
+    for row in stale_rows:
+        rows.remove(row)  # delete-orphan cascade deletes it
+    return changed
+
+
+def ingredient_values(item, position):
+    return {
+        "name": item.get("name", ""),
+        "quantity": item.get("quantity"),
+        "unit": item.get("unit"),
+        "sort_order": item.get("sort_order", position),
+    }
+
+
+def step_values(item, position):
+    return {"body": item.get("body", ""), "sort_order": item.get("sort_order", position)}
+
+
+def sync_ingredients(recipe_post, incoming):
+    names_before = sorted(i.name for i in recipe_post.ingredients)
+    if not _sync(recipe_post.ingredients, incoming, ingredient_values, Ingredient):
+        return set()
+    changes = {"ingredients"}
+    if sorted(i.name for i in recipe_post.ingredients) != names_before:
+        changes.add("ingredient_names")
+    return changes
+
+
+def sync_steps(recipe_post, incoming):
+    return {"steps"} if _sync(recipe_post.steps, incoming, step_values, Step) else set()
+
+
+def sync_tags(post, tags):
+    """Make post's tags exactly tags (Tag objects)."""
+    wanted = {tag.id for tag in tags}
+    current = {post_tag.tag_id for post_tag in post.tags}
+    if wanted == current:
+        return set()
+    for post_tag in [pt for pt in post.tags if pt.tag_id not in wanted]:
+        post.tags.remove(post_tag)
+    for tag_id in sorted(wanted - current):
+        post.tags.append(PostTag(tag_id=tag_id))
+    return {"tags"}
@@ -4,6 +4,7 @@ from app import db, limiter
 from models.user import User
 from models.recipe_box import RecipeBox
 from schemas.user_schema import user_schema
+import suggest_index
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
@@ -48,6 +49,7 @@ def register():
     ]
     db.session.add_all(default_boxes)
     db.session.commit()
+    suggest_index.update_user(user)
 
     login_user(user)
     return jsonify({"data": user_schema.dump(user), "message": "Registration successful"}), 201
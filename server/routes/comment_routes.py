@@ -3,6 +3,7 @@ from flask_login import login_required, current_user
 
 from app import db
 from models.comment import Comment
+import counters
 
 comment_bp = Blueprint("comments", __name__, url_prefix="/api/comments")
 
@@ -19,5 +20,6 @@ def delete_comment(comment_id):
         return jsonify({"error": "Forbidden", "message": "Failed"}), 403
 
     db.session.delete(comment)
+    counters.bump(comment.post_id, comment_count=-1)
     db.session.commit()
     return jsonify({"data": None, "message": "Comment deleted"}), 200
@@ -0,0 +1,212 @@
+import csv
+import io
+import json
+
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from flask_login import login_required, current_user
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app import db
+from models.box_post import BoxPost
+from models.comment import Comment
+from models.follow import Follow
+from models.post import Post
+from models.post_tag import PostTag
+from models.recipe_box import RecipeBox
+from models.recipe_post import RecipePost
+from models.user import User
+
+export_bp = Blueprint("export", __name__, url_prefix="/api/export")
+
+# Rows fetched per round trip from the server-side cursor
+BATCH_SIZE = 200
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+_RECIPE_FIELDS = (
+    "id", "title", "description", "image_url", "cook_time_minutes", "servings", "difficulty",
+    "self_rating", "source_type", "source_url", "source_credit", "source_post_id", "inspo_post_id",
+    "created_at", "updated_at",
+)
+
+
+def _value(value):
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def _recipe_record(post):
+    record = {field: _value(getattr(post, field)) for field in _RECIPE_FIELDS}
+    record["ingredients"] = [
+        {"name": i.name, "quantity": i.quantity, "unit": i.unit} for i in post.ingredients
+    ]
+    record["steps"] = [s.body for s in post.steps]
+    record["tags"] = [pt.tag.name for pt in post.tags]
+    return record
+
+
+def _recipe_csv_row(record):
+    row = dict(record)
+    row["ingredients"] = "; ".join(
+        " ".join(part for part in (i["quantity"], i["unit"], i["name"]) if part) for i in record["ingredients"]
+    )
+    row["steps"] = "\n".join(record["steps"])
+    row["tags"] = "; ".join(record["tags"])
+    return row
+
+
+def _recipes(query):
+    """
+    Stream RecipePosts from a server-side cursor, BATCH_SIZE at a time.
+    Ingredients, steps and tags are selectin-loaded once per batch.
+    """
+    return (
+        query
+        .options(
+            selectinload(RecipePost.ingredients),
+            selectinload(RecipePost.steps),
+            selectinload(RecipePost.tags).joinedload(PostTag.tag),
+        )
+        .yield_per(BATCH_SIZE)
+    )
+
+
+def _ndjson(records):
+    for record in records:
+        yield json.dumps(record) + "\n"
+
+
+def _csv(records, fields):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+
+    def flush():
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writeheader()
+    yield flush()
+    for record in records:
+        writer.writerow(_recipe_csv_row(record))
+        yield flush()
+
+
+def _stream(records, fmt, filename, fields=_RECIPE_FIELDS + ("ingredients", "steps", "tags")):
+    chunks = _ndjson(records) if fmt == "ndjson" else _csv(records, fields)
+    return Response(
+        stream_with_context(chunks),
+        mimetype=FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
+
+
+def _get_format():
+    fmt = request.args.get("format", "ndjson")
+    return fmt if fmt in FORMATS else None
+
+
+# ---------------------------------------------------------------------------
+# Export a box's recipes, newest save first
+# ---------------------------------------------------------------------------
+
+@export_bp.get("/boxes/<int:box_id>")
+def export_box(box_id):
+    fmt = _get_format()
+    if not fmt:
+        return jsonify({"error": "format must be ndjson or csv", "message": "Failed"}), 400
+    box = db.session.get(RecipeBox, box_id)
+    if not box:
+        return jsonify({"error": "Box not found", "message": "Failed"}), 404
+
+    def records():
+        rows = _recipes(
+            RecipePost.query
+            .join(BoxPost, BoxPost.post_id == Post.id)
+            .filter(BoxPost.box_id == box_id)
+            .add_columns(BoxPost.added_at)
+            .order_by(BoxPost.added_at.desc(), BoxPost.post_id.desc())
+        )
+        for post, added_at in rows:
+            yield {**_recipe_record(post), "added_at": _value(added_at)}
+
+    fields = _RECIPE_FIELDS + ("added_at", "ingredients", "steps", "tags")
+    return _stream(records(), fmt, f"box-{box_id}", fields)
+
+
+# ---------------------------------------------------------------------------
+# Export all of a user's recipes, oldest first
+# ---------------------------------------------------------------------------
+
+@export_bp.get("/users/<int:user_id>/posts")
+def export_user_posts(user_id):
+    fmt = _get_format()
+    if not fmt:
+        return jsonify({"error": "format must be ndjson or csv", "message": "Failed"}), 400
+    if not db.session.get(User, user_id):
+        return jsonify({"error": "User not found", "message": "Failed"}), 404
+
+    def records():
+        rows = _recipes(RecipePost.query.filter(Post.user_id == user_id).order_by(Post.id))
+        for post in rows:
+            yield _recipe_record(post)
+
+    return _stream(records(), fmt, f"user-{user_id}-posts")
+
+
+# ---------------------------------------------------------------------------
+# Export the current user's whole account (NDJSON only)
+# ---------------------------------------------------------------------------
+
+@export_bp.get("/account")
+@login_required
+def export_account():
+    # One record per line, tagged with "type": profile, post, box, box_post,
+    # comment and follow, so a single file covers every table.
+    if request.args.get("format", "ndjson") != "ndjson":
+        return jsonify({"error": "Account export is only available as ndjson", "message": "Failed"}), 400
+    user_id = current_user.id
+    profile = {
+        "type": "profile",
+        **{
+            field: _value(getattr(current_user, field))
+            for field in ("id", "email", "username", "display_name", "bio", "profile_image_url", "created_at")
+        },
+    }
+
+    def rows(stmt):
+        return db.session.execute(stmt.execution_options(yield_per=BATCH_SIZE))
+
+    def records():
+        yield profile
+        for post in _recipes(RecipePost.query.filter(Post.user_id == user_id).order_by(Post.id)):
+            yield {"type": "post", **_recipe_record(post)}
+        for box in db.session.scalars(select(RecipeBox).where(RecipeBox.user_id == user_id).order_by(RecipeBox.id)):
+            yield {
+                "type": "box", "id": box.id, "name": box.name, "description": box.description,
+                "box_type": box.box_type, "created_at": _value(box.created_at),
+            }
+        for box_id, post_id, added_at in rows(
+            select(BoxPost.box_id, BoxPost.post_id, BoxPost.added_at)
+            .join(RecipeBox, RecipeBox.id == BoxPost.box_id)
+            .where(RecipeBox.user_id == user_id)
+            .order_by(BoxPost.box_id, BoxPost.added_at)
+        ):
+            yield {"type": "box_post", "box_id": box_id, "post_id": post_id, "added_at": _value(added_at)}
+        for comment_id, post_id, parent_id, body, created_at in rows(
+            select(Comment.id, Comment.post_id, Comment.parent_id, Comment.body, Comment.created_at)
+            .where(Comment.user_id == user_id)
+            .order_by(Comment.id)
+        ):
+            yield {
+                "type": "comment", "id": comment_id, "post_id": post_id, "parent_id": parent_id,
+                "body": body, "created_at": _value(created_at),
+            }
+        for followed_id, created_at in rows(
+            select(Follow.followed_id, Follow.created_at)
+            .where(Follow.follower_id == user_id)
+            .order_by(Follow.created_at)
+        ):
+            yield {"type": "follow", "followed_id": followed_id, "created_at": _value(created_at)}
+
+    return _stream(records(), "ndjson", f"account-{user_id}")
@@ -1,14 +1,17 @@
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 
 from app import db
 from models.recipe_box import RecipeBox
 from models.box_post import BoxPost
-from models.recipe_post import RecipePost
 from models.post import Post
 from schemas.recipe_box_schema import recipe_box_schema, recipe_boxes_schema
 from schemas.recipe_post_schema import recipe_posts_list_schema
-from utils import get_pagination
+from loaders import recipe_list_query
+import box_saves
+from utils import get_pagination, get_cursor_page, trim_page
 
 recipe_box_bp = Blueprint("recipe_boxes", __name__, url_prefix="/api/boxes")
 
@@ -37,32 +40,107 @@ def create_box():
     return jsonify({"data": recipe_box_schema.dump(box), "message": "Box created"}), 201
 
 
+# ---------------------------------------------------------------------------
+# Bulk save / unsave
+# ---------------------------------------------------------------------------
+
+MAX_BULK_OPERATIONS = 100
+
+
+@recipe_box_bp.post("/bulk")
+@login_required
+def bulk_update():
+    # Body: {"operations": [{"post_id", "box_id", "action": "save" | "unsave"}]}.
+    # Unsaves run before saves, so unsave-from-A + save-to-B moves a post.
+    # Each result carries the status the single save/unsave endpoint would return.
+    operations = (request.get_json() or {}).get("operations")
+    if not isinstance(operations, list) or not operations:
+        return jsonify({"error": "operations must be a non-empty list", "message": "Failed"}), 400
+    if len(operations) > MAX_BULK_OPERATIONS:
+        return jsonify({"error": f"At most {MAX_BULK_OPERATIONS} operations per request", "message": "Failed"}), 400
+
+    ops = []
+    for op in operations:
+        op = op if isinstance(op, dict) else {}
+        post_id, box_id, action = op.get("post_id"), op.get("box_id"), op.get("action")
+        # type() rather than isinstance(): JSON true / false are bools, which subclass int
+        ok = type(post_id) is int and type(box_id) is int and action in ("save", "unsave")
+        ops.append((post_id, box_id, action) if ok else None)
+
+    valid = [op for op in ops if op]
+    box_ids = {box_id for _, box_id, _ in valid}
+    boxes = {
+        box.id: box
+        for box in RecipeBox.query.filter(RecipeBox.id.in_(box_ids), RecipeBox.user_id == current_user.id)
+    } if box_ids else {}
+    save_post_ids = {post_id for post_id, box_id, action in valid if action == "save" and box_id in boxes}
+    existing_posts = set(
+        db.session.scalars(select(Post.id).where(Post.id.in_(save_post_ids)))
+    ) if save_post_ids else set()
+
+    unsaves = [(boxes[box_id], post_id) for post_id, box_id, action in valid if action == "unsave" and box_id in boxes]
+    saves = [(boxes[box_id], post_id) for post_id, box_id, action in valid if action == "save" and box_id in boxes and post_id in existing_posts]
+    removed = box_saves.unsave(current_user.id, unsaves)
+    added = box_saves.save(current_user.id, saves)
+    db.session.commit()
+
+    results = []
+    for op, raw in zip(ops, operations):
+        if not op:
+            results.append({"operation": raw, "status": 400, "error": "post_id, box_id and action (save or unsave) are required"})
+            continue
+        post_id, box_id, action = op
+        if box_id not in boxes:
+            status, error = 404, "Box not found or not yours"
+        elif action == "unsave":
+            status, error = (200, None) if (box_id, post_id) in removed else (404, "Post not in this box")
+        elif post_id not in existing_posts:
+            status, error = 404, "Post not found"
+        else:
+            status, error = (201, None) if (box_id, post_id) in added else (409, "Post already in this box")
+        result = {"post_id": post_id, "box_id": box_id, "action": action, "status": status}
+        if error:
+            result["error"] = error
+        results.append(result)
+    return jsonify({"data": results, "message": "Success"}), 200
+
+
 # ---------------------------------------------------------------------------
 # Get box with paginated posts
 # ---------------------------------------------------------------------------
 
 @recipe_box_bp.get("/<int:box_id>")
 def get_box(box_id):
-    box = db.session.get(RecipeBox, box_id)
+    # ?cursor= pages on (added_at, post_id) and stays fast deep into large
+    # boxes; plain ?limit=&offset= is still accepted. Both return next_cursor.
+    cursor_mode = "cursor" in request.args
+    if cursor_mode:
+        try:
+            limit, position = get_cursor_page()
+        except ValueError:
+            return jsonify({"error": "Invalid cursor", "message": "Failed"}), 400
+    else:
+        limit, offset = get_pagination()
+
+    box = RecipeBox.query.options(joinedload(RecipeBox.user)).filter_by(id=box_id).first()
     if not box:
         return jsonify({"error": "Box not found", "message": "Failed"}), 404
 
-    limit, offset = get_pagination()
-
-    # Get recipe posts saved to this box, ordered by when they were added
-    entries = (
-        BoxPost.query
-        .filter_by(box_id=box_id)
-        .order_by(BoxPost.added_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    # Posts saved to this box, newest save first, with their authors — one query
+    query = (
+        recipe_list_query()
+        .join(BoxPost, BoxPost.post_id == Post.id)
+        .filter(BoxPost.box_id == box_id)
+        .add_columns(BoxPost.added_at)
+        .order_by(BoxPost.added_at.desc(), BoxPost.post_id.desc())
     )
-    post_ids = [e.post_id for e in entries]
-    posts = RecipePost.query.filter(RecipePost.id.in_(post_ids)).all() if post_ids else []
-    # Preserve order
-    post_map = {p.id: p for p in posts}
-    ordered_posts = [post_map[pid] for pid in post_ids if pid in post_map]
+    if not cursor_mode:
+        query = query.offset(offset)
+    elif position:
+        query = query.filter(db.tuple_(BoxPost.added_at, BoxPost.post_id) < position)
+    # Fetch one extra row to learn whether another page exists
+    rows, next_cursor = trim_page(query.limit(limit + 1).all(), limit, lambda row: (row[1], row[0].id))
+    ordered_posts = [post for post, _ in rows]
 
     box_data = recipe_box_schema.dump(box)
     if box.user:
@@ -76,6 +154,7 @@ def get_box(box_id):
         "data": {
             "box": box_data,
             "posts": recipe_posts_list_schema.dump(ordered_posts),
+            "next_cursor": next_cursor,
         },
         "message": "Success",
     }), 200
@@ -1,5 +1,7 @@
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app import db
 from models.post import Post
@@ -13,42 +15,63 @@ from models.recipe_box import RecipeBox
 from models.comment import Comment
 from schemas.recipe_post_schema import (
     recipe_post_detail_schema,
+    recipe_posts_detail_schema,
     recipe_posts_list_schema,
 )
 from schemas.comment_schema import comment_schema, comments_schema
-from utils import get_pagination
+from loaders import (
+    recipe_list_query,
+    load_recipe_list,
+    load_recipe_detail,
+    load_recipe_details,
+    comment_thread_query,
+)
+import box_saves
+import counters
+import lineage
+import pantry
+import post_cache
+import recipe_diff
+import search_index
+import suggest_index
+import timeline
+from utils import get_pagination, get_cursor_page, parse_id_list, trim_page
 
 recipe_post_bp = Blueprint("recipe_posts", __name__, url_prefix="/api/posts")
 
 
 def _resolve_tags(tag_data):
     """
-    Return Tag objects for the given tag data.
+    Return Tag objects for the given tag data, in order and without repeats.
     Accepts a list of strings (look up by name only) or
     dicts with {name, category} (create if not found).
+    New tags go in with one INSERT ... ON CONFLICT and every tag is then read
+    back with one IN query, however many tags are sent.
     """
-    tags = []
+    names, new_tags = [], {}
     for item in tag_data:
         if isinstance(item, str):
+            # Unknown plain names are skipped — category required to create new tags
             name = item.strip().lower()
-            if not name:
-                continue
-            tag = Tag.query.filter_by(name=name).first()
-            if tag:
-                tags.append(tag)
-            # Skip unknown tag names — category required to create new tags
         elif isinstance(item, dict):
             name = (item.get("name") or "").strip().lower()
-            category = item.get("category", "cuisine")
-            if not name:
-                continue
-            tag = Tag.query.filter_by(name=name).first()
-            if not tag:
-                tag = Tag(name=name, category=category)
-                db.session.add(tag)
-                db.session.flush()
-            tags.append(tag)
-    return tags
+            if name:
+                new_tags.setdefault(name, item.get("category", "cuisine"))
+        else:
+            continue
+        if name and name not in names:
+            names.append(name)
+    if not names:
+        return []
+
+    if new_tags:
+        db.session.execute(
+            pg_insert(Tag)
+            .values([{"name": name, "category": category} for name, category in new_tags.items()])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+    tags = {tag.name: tag for tag in Tag.query.filter(Tag.name.in_(names))}
+    return [tags[name] for name in names if name in tags]
 
 
 # ---------------------------------------------------------------------------
@@ -100,31 +123,27 @@ def create_recipe():
     )
     db.session.add(recipe_post)
     db.session.flush()  # get recipe_post.id
-
-    # Ingredients
-    for i, ing in enumerate(data.get("ingredients", [])):
-        db.session.add(Ingredient(
-            recipe_post_id=recipe_post.id,
-            name=ing.get("name", ""),
-            quantity=ing.get("quantity"),
-            unit=ing.get("unit"),
-            sort_order=ing.get("sort_order", i),
-        ))
-
-    # Steps
-    for i, step in enumerate(data.get("steps", [])):
-        db.session.add(Step(
-            recipe_post_id=recipe_post.id,
-            body=step.get("body", ""),
-            sort_order=step.get("sort_order", i),
-        ))
-
-    # Tags
-    for tag in _resolve_tags(data.get("tags", [])):
-        db.session.add(PostTag(post_id=recipe_post.id, tag_id=tag.id))
+    counters.bump(recipe_post.source_post_id, fork_count=1)
+    counters.bump_user(current_user.id, post_count=1)
+
+    # Ingredients, steps and tags each go in as one multi-row INSERT
+    ingredients = [recipe_diff.ingredient_values(ing, i) for i, ing in enumerate(data.get("ingredients", []))]
+    steps = [recipe_diff.step_values(step, i) for i, step in enumerate(data.get("steps", []))]
+    tags = _resolve_tags(data.get("tags", []))
+    if ingredients:
+        db.session.execute(insert(Ingredient).values([{**row, "recipe_post_id": recipe_post.id} for row in ingredients]))
+    if steps:
+        db.session.execute(insert(Step).values([{**row, "recipe_post_id": recipe_post.id} for row in steps]))
+    if tags:
+        db.session.execute(insert(PostTag).values([{"post_id": recipe_post.id, "tag_id": tag.id} for tag in tags]))
+
+    search_index.reindex_post(recipe_post.id)
+    pantry.reindex_post(recipe_post.id)
+    timeline.fan_out_post(recipe_post.id, current_user.id)
 
     db.session.commit()
-    db.session.refresh(recipe_post)
+    recipe_post = load_recipe_detail(recipe_post.id)
+    suggest_index.update_recipe(after=suggest_index.recipe_snapshot(recipe_post))
     return jsonify({"data": recipe_post_detail_schema.dump(recipe_post), "message": "Post created"}), 201
 
 
@@ -135,22 +154,40 @@ def create_recipe():
 @recipe_post_bp.get("/feed")
 @login_required
 def feed():
-    limit, offset = get_pagination()
-    followed_ids = [f.followed_id for f in current_user.following]
-
-    if not followed_ids:
-        return jsonify({"data": [], "message": "Success"}), 200
-
-    # RecipePost.query already joins `posts` via polymorphic inheritance — no explicit join needed
-    posts = (
-        RecipePost.query
-        .filter(Post.user_id.in_(followed_ids))
-        .order_by(Post.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    # ?cursor= switches to keyset paging on (created_at, id) and returns
+    # {posts, next_cursor}; an empty cursor starts at the top. Plain
+    # ?limit=&offset= still returns a bare list for older clients.
+    cursor_mode = "cursor" in request.args
+    if cursor_mode:
+        try:
+            limit, position = get_cursor_page()
+        except ValueError:
+            return jsonify({"error": "Invalid cursor", "message": "Failed"}), 400
+    else:
+        limit, offset = get_pagination()
+
+    # Rows come from the reader's materialized timeline — see timeline.py
+    rows = timeline.feed_rows(current_user.id)
+    # RecipePost queries already join `posts` via polymorphic inheritance — no explicit join needed
+    query = (
+        recipe_list_query()
+        .join(rows, rows.c.post_id == Post.id)
+        .order_by(rows.c.created_at.desc(), rows.c.post_id.desc())
     )
-    return jsonify({"data": recipe_posts_list_schema.dump(posts), "message": "Success"}), 200
+
+    if not cursor_mode:
+        posts = query.offset(offset).limit(limit).all()
+        return jsonify({"data": recipe_posts_list_schema.dump(posts), "message": "Success"}), 200
+
+    if position:
+        query = query.filter(db.tuple_(rows.c.created_at, rows.c.post_id) < position)
+    # Fetch one extra row to learn whether another page exists
+    posts, next_cursor = trim_page(query.limit(limit + 1).all(), limit, lambda post: (post.created_at, post.id))
+
+    return jsonify({
+        "data": {"posts": recipe_posts_list_schema.dump(posts), "next_cursor": next_cursor},
+        "message": "Success",
+    }), 200
 
 
 # ---------------------------------------------------------------------------
@@ -160,7 +197,7 @@ def feed():
 @recipe_post_bp.get("/recipe/cook/<int:post_id>")
 @login_required
 def cook_data(post_id):
-    source = db.session.get(RecipePost, post_id)
+    source = load_recipe_detail(post_id)
     if not source:
         return jsonify({"error": "Post not found", "message": "Failed"}), 404
 
@@ -184,16 +221,92 @@ def cook_data(post_id):
     }), 200
 
 
+# ---------------------------------------------------------------------------
+# Many posts by id
+# ---------------------------------------------------------------------------
+
+@recipe_post_bp.get("")
+def get_posts():
+    # ?ids=1,2,3 (max 100) in request order; ids that don't exist are skipped.
+    # ?shape=list (default) returns feed cards, ?shape=detail full posts.
+    try:
+        post_ids = parse_id_list()
+    except ValueError as exc:
+        return jsonify({"error": str(exc), "message": "Failed"}), 400
+    shape = request.args.get("shape", "list")
+    if shape == "list":
+        data = recipe_posts_list_schema.dump(load_recipe_list(post_ids))
+    elif shape == "detail":
+        data = recipe_posts_detail_schema.dump(load_recipe_details(post_ids))
+    else:
+        return jsonify({"error": "shape must be list or detail", "message": "Failed"}), 400
+    return jsonify({"data": data, "message": "Success"}), 200
+
+
 # ---------------------------------------------------------------------------
 # Single post detail
 # ---------------------------------------------------------------------------
 
 @recipe_post_bp.get("/<int:post_id>")
 def get_post(post_id):
-    post = db.session.get(RecipePost, post_id)
-    if not post:
+    # A one-row version probe decides between the cached dump and a full load;
+    # clients revalidate with If-None-Match and get a 304. No Last-Modified:
+    # the version covers counters and nested cards that don't move updated_at.
+    version = post_cache.version(post_id)
+    if version is None:
         return jsonify({"error": "Post not found", "message": "Failed"}), 404
-    return jsonify({"data": recipe_post_detail_schema.dump(post), "message": "Success"}), 200
+    data = post_cache.get(post_id, version)
+    if data is None:
+        post = load_recipe_detail(post_id)
+        if not post:
+            return jsonify({"error": "Post not found", "message": "Failed"}), 404
+        data = recipe_post_detail_schema.dump(post)
+        post_cache.put(post_id, version, data)
+
+    response = jsonify({"data": data, "message": "Success"})
+    response.set_etag(post_cache.etag(post_id, version))
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@recipe_post_bp.get("/cache-stats")
+def get_post_cache_stats():
+    return jsonify({"data": post_cache.stats(), "message": "Success"}), 200
+
+
+# ---------------------------------------------------------------------------
+# Fork / inspiration lineage
+# ---------------------------------------------------------------------------
+
+@recipe_post_bp.get("/<int:post_id>/lineage")
+def get_lineage(post_id):
+    try:
+        depth = min(max(int(request.args.get("depth", 5)), 1), 10)
+        limit = min(max(int(request.args.get("limit", 50)), 1), 200)
+    except (ValueError, TypeError):
+        return jsonify({"error": "depth and limit must be integers", "message": "Failed"}), 400
+
+    tree = lineage.walk(post_id, depth, limit)
+    items = tree["ancestors"] + tree["descendants"]
+    cards = {
+        card["id"]: card
+        for card in recipe_posts_list_schema.dump(load_recipe_list([post_id] + [i["post_id"] for i in items]))
+    }
+    if post_id not in cards:
+        return jsonify({"error": "Post not found", "message": "Failed"}), 404
+
+    def with_cards(found):
+        return [{**item, "post": cards[item["post_id"]]} for item in found if item["post_id"] in cards]
+
+    return jsonify({
+        "data": {
+            "post": cards[post_id],
+            "ancestors": with_cards(tree["ancestors"]),
+            "descendants": with_cards(tree["descendants"]),
+            "truncated": tree["truncated"],
+        },
+        "message": "Success",
+    }), 200
 
 
 # ---------------------------------------------------------------------------
@@ -210,55 +323,49 @@ def update_post(post_id):
         return jsonify({"error": "Forbidden", "message": "Failed"}), 403
 
     data = request.get_json() or {}
+    before = suggest_index.recipe_snapshot(recipe_post) if suggest_index.is_built() else None
 
-    # Update Post fields
-    for field in ("image_url", "description"):
-        if field in data:
-            setattr(recipe_post, field, data[field])
-
-    # Update RecipePost fields
+    # Only what actually differs is written; changes names each part that did
+    changes = set()
+    post_fields = ("image_url", "description")
     recipe_fields = (
         "title", "cook_time_minutes", "servings", "difficulty", "self_rating",
         "source_type", "source_url", "source_post_id", "source_credit",
         "inspo_post_id", "inspo_user_id", "parsed_image_url",
     )
-    for field in recipe_fields:
+    old_source_post_id = recipe_post.source_post_id
+    for field in post_fields + recipe_fields:
         if field in data:
             val = data[field]
             if field == "difficulty":
                 val = val.lower() if val else None
-            setattr(recipe_post, field, val)
+            if getattr(recipe_post, field) != val:
+                setattr(recipe_post, field, val)
+                changes.add(field)
+    if recipe_post.source_post_id != old_source_post_id:
+        counters.bump(old_source_post_id, fork_count=-1)
+        counters.bump(recipe_post.source_post_id, fork_count=1)
 
-    # Replace ingredients if provided
     if "ingredients" in data:
-        Ingredient.query.filter_by(recipe_post_id=post_id).delete()
-        for i, ing in enumerate(data["ingredients"]):
-            db.session.add(Ingredient(
-                recipe_post_id=post_id,
-                name=ing.get("name", ""),
-                quantity=ing.get("quantity"),
-                unit=ing.get("unit"),
-                sort_order=ing.get("sort_order", i),
-            ))
-
-    # Replace steps if provided
+        changes |= recipe_diff.sync_ingredients(recipe_post, data["ingredients"])
     if "steps" in data:
-        Step.query.filter_by(recipe_post_id=post_id).delete()
-        for i, step in enumerate(data["steps"]):
-            db.session.add(Step(
-                recipe_post_id=post_id,
-                body=step.get("body", ""),
-                sort_order=step.get("sort_order", i),
-            ))
-
-    # Replace tags if provided
+        changes |= recipe_diff.sync_steps(recipe_post, data["steps"])
     if "tags" in data:
-        PostTag.query.filter_by(post_id=post_id).delete()
-        for tag in _resolve_tags(data["tags"]):
-            db.session.add(PostTag(post_id=post_id, tag_id=tag.id))
-
-    db.session.commit()
-    db.session.refresh(recipe_post)
+        changes |= recipe_diff.sync_tags(recipe_post, _resolve_tags(data["tags"]))
+
+    if changes:
+        if changes & {"title", "description", "ingredient_names", "steps", "tags"}:
+            search_index.reindex_post(post_id)
+        if "ingredient_names" in changes:
+            pantry.reindex_post(post_id)
+        # Every edit moves updated_at, including ones that only touch
+        # recipe_posts or child rows; the detail cache and ETags are keyed on it
+        recipe_post.updated_at = db.func.now()
+        db.session.commit()
+        post_cache.invalidate(post_id)
+    recipe_post = load_recipe_detail(post_id)
+    if before and changes & {"title", "ingredient_names", "tags"}:
+        suggest_index.update_recipe(before=before, after=suggest_index.recipe_snapshot(recipe_post))
     return jsonify({"data": recipe_post_detail_schema.dump(recipe_post), "message": "Post updated"}), 200
 
 
@@ -275,13 +382,21 @@ def delete_post(post_id):
     if recipe_post.user_id != current_user.id:
         return jsonify({"error": "Forbidden", "message": "Failed"}), 403
 
+    before = suggest_index.recipe_snapshot(recipe_post) if suggest_index.is_built() else None
+
     # Null out references from other posts before deleting
     RecipePost.query.filter_by(source_post_id=post_id).update({"source_post_id": None})
     RecipePost.query.filter_by(inspo_post_id=post_id).update({"inspo_post_id": None})
+    timeline.remove_post(post_id)
+    counters.bump(recipe_post.source_post_id, fork_count=-1)
+    counters.bump_user(recipe_post.user_id, post_count=-1)
     db.session.flush()
 
     db.session.delete(recipe_post)
     db.session.commit()
+    post_cache.invalidate(post_id)
+    if before:
+        suggest_index.update_recipe(before=before)
     return jsonify({"data": None, "message": "Post deleted"}), 200
 
 
@@ -289,6 +404,28 @@ def delete_post(post_id):
 # Get boxes (for current user) that contain a post
 # ---------------------------------------------------------------------------
 
+@recipe_post_bp.get("/saved-boxes")
+@login_required
+def get_saved_boxes_batch():
+    # ?ids=1,2,3 -> {post_id: [box_id, ...]} for a page of cards, in one query
+    try:
+        post_ids = parse_id_list()
+    except ValueError as exc:
+        return jsonify({"error": str(exc), "message": "Failed"}), 400
+
+    saved = {post_id: [] for post_id in post_ids}
+    if post_ids:
+        rows = db.session.execute(
+            select(BoxPost.post_id, BoxPost.box_id)
+            .join(RecipeBox, RecipeBox.id == BoxPost.box_id)
+            .where(BoxPost.post_id.in_(post_ids), RecipeBox.user_id == current_user.id)
+            .order_by(BoxPost.post_id, BoxPost.box_id)
+        )
+        for post_id, box_id in rows:
+            saved[post_id].append(box_id)
+    return jsonify({"data": saved, "message": "Success"}), 200
+
+
 @recipe_post_bp.get("/<int:post_id>/saved-boxes")
 @login_required
 def get_saved_boxes(post_id):
@@ -319,20 +456,11 @@ def save_post(post_id):
     if not post:
         return jsonify({"error": "Post not found", "message": "Failed"}), 404
 
-    existing = BoxPost.query.filter_by(box_id=box_id, post_id=post_id).first()
-    if existing:
+    # Saving to any box also adds the post to the Recipe Box (liked)
+    if (box.id, post_id) not in box_saves.save(current_user.id, [(box, post_id)]):
+        db.session.rollback()
         return jsonify({"error": "Post already in this box", "message": "Failed"}), 409
 
-    db.session.add(BoxPost(box_id=box_id, post_id=post_id))
-
-    # Auto-add to Recipe Box (liked) whenever saving to any other box
-    if box.box_type != "liked":
-        recipe_box = RecipeBox.query.filter_by(user_id=current_user.id, box_type="liked").first()
-        if recipe_box:
-            rb_existing = BoxPost.query.filter_by(box_id=recipe_box.id, post_id=post_id).first()
-            if not rb_existing:
-                db.session.add(BoxPost(box_id=recipe_box.id, post_id=post_id))
-
     db.session.commit()
     return jsonify({"data": {"box_id": box_id, "post_id": post_id}, "message": "Saved"}), 201
 
@@ -348,22 +476,11 @@ def unsave_post(post_id, box_id):
     if not box or box.user_id != current_user.id:
         return jsonify({"error": "Box not found or not yours", "message": "Failed"}), 404
 
-    entry = BoxPost.query.filter_by(box_id=box_id, post_id=post_id).first()
-    if not entry:
+    # Removing from Recipe Box cascades to all of the user's other boxes
+    if (box.id, post_id) not in box_saves.unsave(current_user.id, [(box, post_id)]):
+        db.session.rollback()
         return jsonify({"error": "Post not in this box", "message": "Failed"}), 404
 
-    # Removing from Recipe Box cascades to all of the user's other boxes
-    if box.box_type == "liked":
-        other_boxes = RecipeBox.query.filter(
-            RecipeBox.user_id == current_user.id,
-            RecipeBox.box_type != "liked",
-        ).all()
-        for other_box in other_boxes:
-            other_entry = BoxPost.query.filter_by(box_id=other_box.id, post_id=post_id).first()
-            if other_entry:
-                db.session.delete(other_entry)
-
-    db.session.delete(entry)
     db.session.commit()
     return jsonify({"data": None, "message": "Removed from box"}), 200
 
@@ -377,7 +494,12 @@ def get_comments(post_id):
     post = db.session.get(Post, post_id)
     if not post:
         return jsonify({"error": "Post not found", "message": "Failed"}), 404
-    top_level = Comment.query.filter_by(post_id=post_id, parent_id=None).order_by(Comment.created_at).all()
+    top_level = (
+        comment_thread_query()
+        .filter_by(post_id=post_id, parent_id=None)
+        .order_by(Comment.created_at)
+        .all()
+    )
     return jsonify({"data": comments_schema.dump(top_level), "message": "Success"}), 200
 
 
@@ -408,5 +530,6 @@ def add_comment(post_id):
         body=body,
     )
     db.session.add(comment)
+    counters.bump(post_id, comment_count=1)
     db.session.commit()
     return jsonify({"data": comment_schema.dump(comment), "message": "Comment added"}), 201
@@ -1,19 +1,19 @@
-from datetime import datetime, timedelta
-
 from flask import Blueprint, request, jsonify
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, select, tuple_
 
 from app import db
 from models.post import Post
 from models.recipe_post import RecipePost
-from models.ingredient import Ingredient
 from models.tag import Tag
 from models.post_tag import PostTag
-from models.box_post import BoxPost
-from models.recipe_box import RecipeBox
 from models.user import User
-from schemas.recipe_post_schema import recipe_posts_list_schema
+from schemas.recipe_post_schema import recipe_post_list_schema, recipe_posts_list_schema
 from schemas.user_schema import users_schema
+from loaders import recipe_list_query, load_recipe_list
+import pantry
+import search_index
+import suggest_index
+import trending
 from utils import get_pagination
 
 search_bp = Blueprint("search", __name__, url_prefix="/api/search")
@@ -21,7 +21,8 @@ explore_bp = Blueprint("explore", __name__, url_prefix="/api")
 
 
 # ---------------------------------------------------------------------------
-# Recipe search — title + ingredient name
+# Recipe search — full-text over title, tags, ingredients, description, steps,
+# plus typo-tolerant trigram matches on title and ingredient names
 # ---------------------------------------------------------------------------
 
 @search_bp.get("/recipes")
@@ -31,32 +32,38 @@ def search_recipes():
         return jsonify({"error": "q parameter is required", "message": "Failed"}), 400
 
     limit, offset = get_pagination()
-    like = f"%{q}%"
+    sort = request.args.get("sort", "recent")
 
-    # Posts matching title
-    title_ids = (
-        db.session.query(RecipePost.id)
-        .filter(RecipePost.title.ilike(like))
-    )
+    # RecipePost queries already join `posts` via polymorphic inheritance
+    query = recipe_list_query().filter(RecipePost.id.in_(search_index.matching_ids(q)))
+    if sort == "relevance":
+        query = query.order_by(search_index.relevance(q).desc(), Post.created_at.desc())
+    else:  # recent (default)
+        query = query.order_by(Post.created_at.desc())
 
-    # Posts matching an ingredient name
-    ingredient_ids = (
-        db.session.query(Ingredient.recipe_post_id)
-        .filter(Ingredient.name.ilike(like))
-    )
+    posts = query.offset(offset).limit(limit).all()
+    return jsonify({"data": recipe_posts_list_schema.dump(posts), "message": "Success"}), 200
 
-    all_ids = title_ids.union(ingredient_ids).subquery()
 
-    # RecipePost.query already joins `posts` via polymorphic inheritance
-    posts = (
-        RecipePost.query
-        .filter(RecipePost.id.in_(db.session.query(all_ids)))
-        .order_by(Post.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
-    return jsonify({"data": recipe_posts_list_schema.dump(posts), "message": "Success"}), 200
+# ---------------------------------------------------------------------------
+# Autocomplete — typed suggestions from the in-memory prefix index
+# ---------------------------------------------------------------------------
+
+@search_bp.get("/suggest")
+def suggest():
+    q = (request.args.get("q") or "").strip()
+    if not q:
+        return jsonify({"error": "q parameter is required", "message": "Failed"}), 400
+
+    try:
+        limit = min(int(request.args.get("limit", 8)), 20)
+    except (ValueError, TypeError):
+        limit = 8
+    types = suggest_index.SUGGESTION_TYPES
+    if request.args.get("types"):
+        types = tuple(t for t in request.args["types"].split(",") if t in suggest_index.SUGGESTION_TYPES)
+
+    return jsonify({"data": suggest_index.suggest(q, limit, types), "message": "Success"}), 200
 
 
 # ---------------------------------------------------------------------------
@@ -88,9 +95,9 @@ def search_by_tag():
         .subquery()
     )
 
-    # RecipePost.query already joins `posts` via polymorphic inheritance
+    # RecipePost queries already join `posts` via polymorphic inheritance
     posts = (
-        RecipePost.query
+        recipe_list_query()
         .filter(RecipePost.id.in_(db.session.query(post_ids_q)))
         .order_by(Post.created_at.desc())
         .offset(offset)
@@ -100,6 +107,169 @@ def search_by_tag():
     return jsonify({"data": recipe_posts_list_schema.dump(posts), "message": "Success"}), 200
 
 
+# ---------------------------------------------------------------------------
+# Faceted recipe search — text + tags + range filters, with facet counts
+# ---------------------------------------------------------------------------
+
+_DIFFICULTIES = ("easy", "medium", "hard")
+_SOURCE_TYPES = ("original", "external", "internal", "credit")
+# query param -> (column, comparison)
+_RANGE_FILTERS = {
+    "min_cook_time": (RecipePost.cook_time_minutes, "ge"),
+    "max_cook_time": (RecipePost.cook_time_minutes, "le"),
+    "min_servings": (RecipePost.servings, "ge"),
+    "max_servings": (RecipePost.servings, "le"),
+    "min_rating": (RecipePost.self_rating, "ge"),
+}
+
+
+def _csv_arg(name):
+    return [v.strip().lower() for v in (request.args.get(name) or "").split(",") if v.strip()]
+
+
+def _faceted_filters():
+    """
+    Build WHERE clauses from the faceted search query params.
+    Returns (filters, error_message).
+    """
+    filters = []
+
+    q = (request.args.get("q") or "").strip()
+    if q:
+        filters.append(RecipePost.id.in_(search_index.matching_ids(q)))
+
+    tag_names = _csv_arg("tags")
+    if tag_names:
+        tag_mode = request.args.get("tag_mode", "and")
+        if tag_mode not in ("and", "or"):
+            return None, "tag_mode must be 'and' or 'or'"
+        tagged = select(PostTag.post_id).join(Tag, Tag.id == PostTag.tag_id).where(Tag.name.in_(tag_names))
+        if tag_mode == "and":
+            tagged = tagged.group_by(PostTag.post_id).having(
+                func.count(PostTag.tag_id.distinct()) == len(set(tag_names))
+            )
+        filters.append(RecipePost.id.in_(tagged))
+
+    for name, allowed, column in (
+        ("difficulty", _DIFFICULTIES, RecipePost.difficulty),
+        ("source_type", _SOURCE_TYPES, RecipePost.source_type),
+    ):
+        values = _csv_arg(name)
+        if any(v not in allowed for v in values):
+            return None, f"{name} must be one of: {', '.join(allowed)}"
+        if values:
+            filters.append(column.in_(values))
+
+    for name, (column, op) in _RANGE_FILTERS.items():
+        raw = request.args.get(name)
+        if raw is None or raw == "":
+            continue
+        try:
+            bound = int(raw)
+        except ValueError:
+            return None, f"{name} must be an integer"
+        filters.append(column >= bound if op == "ge" else column <= bound)
+
+    return filters, None
+
+
+def _facet_counts(filters):
+    """
+    Tag (per category) and difficulty facet counts plus the total, in one
+    round trip: GROUPING SETS ((category, name), (difficulty), ()).
+    """
+    matched = select(RecipePost.id, RecipePost.difficulty).where(*filters).subquery()
+    rows = db.session.execute(
+        select(
+            Tag.category,
+            Tag.name,
+            matched.c.difficulty,
+            func.count(matched.c.id.distinct()),
+            func.grouping(Tag.name),
+            func.grouping(matched.c.difficulty),
+        )
+        .select_from(matched)
+        .outerjoin(PostTag, PostTag.post_id == matched.c.id)
+        .outerjoin(Tag, Tag.id == PostTag.tag_id)
+        .group_by(func.grouping_sets(
+            tuple_(Tag.category, Tag.name),
+            tuple_(matched.c.difficulty),
+            tuple_(),
+        ))
+    )
+
+    facets = {"cuisine": [], "dietary": [], "difficulty": []}
+    total = 0
+    for category, name, difficulty, count, name_rolled_up, difficulty_rolled_up in rows:
+        if name_rolled_up and difficulty_rolled_up:
+            total = count
+        elif not name_rolled_up:
+            if name is not None:  # posts with no tags
+                facets[category].append({"name": name, "count": count})
+        elif difficulty is not None:
+            facets["difficulty"].append({"value": difficulty, "count": count})
+
+    for values in facets.values():
+        values.sort(key=lambda f: -f["count"])
+    return facets, total
+
+
+@search_bp.get("/faceted")
+def faceted_search():
+    filters, error = _faceted_filters()
+    if error:
+        return jsonify({"error": error, "message": "Failed"}), 400
+
+    limit, offset = get_pagination()
+    q = (request.args.get("q") or "").strip()
+
+    query = recipe_list_query().filter(*filters)
+    if q and request.args.get("sort") == "relevance":
+        query = query.order_by(search_index.relevance(q).desc(), Post.created_at.desc())
+    else:
+        query = query.order_by(Post.created_at.desc())
+    posts = query.offset(offset).limit(limit).all()
+
+    facets, total = _facet_counts(filters)
+    return jsonify({
+        "data": {"posts": recipe_posts_list_schema.dump(posts), "total": total, "facets": facets},
+        "message": "Success",
+    }), 200
+
+
+# ---------------------------------------------------------------------------
+# Pantry search — recipes ranked by how much of them the given ingredients cover
+# ---------------------------------------------------------------------------
+
+@search_bp.get("/pantry")
+def pantry_search():
+    ingredients = [i.strip() for i in (request.args.get("ingredients") or "").split(",") if i.strip()]
+    if not ingredients:
+        return jsonify({"error": "ingredients parameter is required", "message": "Failed"}), 400
+
+    max_missing = request.args.get("max_missing")
+    if max_missing is not None:
+        try:
+            max_missing = max(int(max_missing), 0)
+        except ValueError:
+            return jsonify({"error": "max_missing must be an integer", "message": "Failed"}), 400
+
+    limit, offset = get_pagination()
+    total, matches = pantry.match(ingredients, limit, offset, max_missing)
+    posts = {p.id: p for p in load_recipe_list([m["post_id"] for m in matches])}
+
+    results = []
+    for m in matches:
+        if m["post_id"] in posts:
+            results.append({
+                "post": recipe_post_list_schema.dump(posts[m["post_id"]]),
+                "coverage": m["coverage"],
+                "have": m["have"],
+                "missing": m["missing"],
+            })
+    return jsonify({"data": {"results": results, "total": total}, "message": "Success"}), 200
+
+
 # ---------------------------------------------------------------------------
 # User search
 # ---------------------------------------------------------------------------
@@ -113,12 +283,18 @@ def search_users():
     limit, offset = get_pagination()
     like = f"%{q}%"
 
+    # Substring or trigram-similar (`%`, typo-tolerant) matches, both served by
+    # the pg_trgm GIN indexes; closest names first
+    similarity = func.greatest(func.similarity(User.username, q), func.similarity(User.display_name, q))
     users = (
         User.query
         .filter(or_(
             User.display_name.ilike(like),
             User.username.ilike(like),
+            User.display_name.op("%")(q),
+            User.username.op("%")(q),
         ))
+        .order_by(similarity.desc(), User.username)
         .offset(offset)
         .limit(limit)
         .all()
@@ -134,37 +310,23 @@ def search_users():
 def explore():
     sort = request.args.get("sort", "recent")
     limit = 12
-    cutoff = datetime.utcnow() - timedelta(days=30)
-
+    try:
+        window = int(request.args.get("window", 30))
+    except ValueError:
+        window = None
+    if window not in trending.WINDOWS:
+        windows = ", ".join(str(w) for w in trending.WINDOWS)
+        return jsonify({"error": f"window must be one of: {windows}", "message": "Failed"}), 400
+
+    # Leaderboards are precomputed by `flask trending refresh` — see trending.py
     if sort == "most_saved":
-        rows = (
-            db.session.query(BoxPost.post_id, func.count(BoxPost.post_id).label("save_count"))
-            .filter(BoxPost.added_at >= cutoff)
-            .group_by(BoxPost.post_id)
-            .order_by(func.count(BoxPost.post_id).desc())
-            .limit(limit)
-            .all()
-        )
-        ids = [r.post_id for r in rows]
-        posts_map = {p.id: p for p in RecipePost.query.filter(RecipePost.id.in_(ids)).all()}
-        posts = [posts_map[pid] for pid in ids if pid in posts_map]
+        posts = load_recipe_list(trending.top_post_ids("saves", window, limit))
 
     elif sort == "most_cooked":
-        rows = (
-            db.session.query(BoxPost.post_id, func.count(BoxPost.post_id).label("cook_count"))
-            .join(RecipeBox, RecipeBox.id == BoxPost.box_id)
-            .filter(RecipeBox.box_type == "cooked", BoxPost.added_at >= cutoff)
-            .group_by(BoxPost.post_id)
-            .order_by(func.count(BoxPost.post_id).desc())
-            .limit(limit)
-            .all()
-        )
-        ids = [r.post_id for r in rows]
-        posts_map = {p.id: p for p in RecipePost.query.filter(RecipePost.id.in_(ids)).all()}
-        posts = [posts_map[pid] for pid in ids if pid in posts_map]
+        posts = load_recipe_list(trending.top_post_ids("cooks", window, limit))
 
     else:  # recent (default)
-        posts = RecipePost.query.order_by(Post.created_at.desc()).limit(limit).all()
+        posts = recipe_list_query().order_by(Post.created_at.desc()).limit(limit).all()
 
     return jsonify({
         "data": {"posts": recipe_posts_list_schema.dump(posts)},
@@ -1,20 +1,45 @@
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy import and_, exists, literal, select, tuple_
+from sqlalchemy.orm import aliased
 
 from app import db
 from models.user import User
-from models.recipe_post import RecipePost
 from models.post import Post
-from models.recipe_box import RecipeBox
 from models.follow import Follow
 from schemas.user_schema import user_profile_schema, users_schema
 from schemas.recipe_post_schema import recipe_posts_list_schema
-from schemas.recipe_box_schema import recipe_boxes_schema
-from utils import get_pagination
+from schemas.recipe_box_schema import recipe_box_schema
+from loaders import load_box_summaries, recipe_list_query
+import counters
+import follow_suggestions
+import suggest_index
+import timeline
+from utils import get_pagination, get_cursor_page, trim_page
 
 user_bp = Blueprint("users", __name__, url_prefix="/api/users")
 
 
+# ---------------------------------------------------------------------------
+# Who to follow — precomputed by `flask suggestions refresh`
+# ---------------------------------------------------------------------------
+
+@user_bp.get("/suggestions")
+@login_required
+def get_suggestions():
+    try:
+        limit = min(max(int(request.args.get("limit", 10)), 1), 20)
+    except (ValueError, TypeError):
+        limit = 10
+
+    rows = follow_suggestions.suggestions_for(current_user.id, limit)
+    suggestions = [
+        {**user, "mutual_follows": s.mutual_follows, "co_saves": s.co_saves}
+        for user, (_, s) in zip(users_schema.dump([r[0] for r in rows]), rows)
+    ]
+    return jsonify({"data": suggestions, "message": "Success"}), 200
+
+
 # ---------------------------------------------------------------------------
 # Public profile
 # ---------------------------------------------------------------------------
@@ -24,7 +49,12 @@ def get_user(user_id):
     user = db.session.get(User, user_id)
     if not user:
         return jsonify({"error": "User not found", "message": "Failed"}), 404
-    return jsonify({"data": user_profile_schema.dump(user), "message": "Success"}), 200
+
+    profile = user_profile_schema.dump(user)
+    profile["is_followed_by_me"] = current_user.is_authenticated and db.session.scalar(
+        select(exists().where(Follow.follower_id == current_user.id, Follow.followed_id == user_id))
+    )
+    return jsonify({"data": profile, "message": "Success"}), 200
 
 
 # ---------------------------------------------------------------------------
@@ -45,6 +75,7 @@ def update_user(user_id):
             setattr(user, field, data[field])
 
     db.session.commit()
+    suggest_index.update_user(user)
     return jsonify({"data": user_profile_schema.dump(user), "message": "Profile updated"}), 200
 
 
@@ -59,9 +90,9 @@ def get_user_posts(user_id):
         return jsonify({"error": "User not found", "message": "Failed"}), 404
 
     limit, offset = get_pagination()
-    # RecipePost.query already joins `posts` via polymorphic inheritance — no explicit join needed
+    # RecipePost queries already join `posts` via polymorphic inheritance — no explicit join needed
     posts = (
-        RecipePost.query
+        recipe_list_query()
         .filter(Post.user_id == user_id)
         .order_by(Post.created_at.desc())
         .offset(offset)
@@ -81,8 +112,14 @@ def get_user_boxes(user_id):
     if not user:
         return jsonify({"error": "User not found", "message": "Failed"}), 404
 
-    boxes = RecipeBox.query.filter_by(user_id=user_id).all()
-    return jsonify({"data": recipe_boxes_schema.dump(boxes), "message": "Success"}), 200
+    boxes = []
+    for box, post_count, last_added_at, covers in load_box_summaries(user_id):
+        data = recipe_box_schema.dump(box)
+        data["post_count"] = post_count
+        data["last_added_at"] = last_added_at.isoformat() if last_added_at else None
+        data["cover_images"] = covers
+        boxes.append(data)
+    return jsonify({"data": boxes, "message": "Success"}), 200
 
 
 # ---------------------------------------------------------------------------
@@ -104,6 +141,9 @@ def follow_user(user_id):
         return jsonify({"error": "Already following this user", "message": "Failed"}), 409
 
     db.session.add(Follow(follower_id=current_user.id, followed_id=user_id))
+    counters.bump_user(current_user.id, following_count=1)
+    counters.bump_user(user_id, follower_count=1)
+    timeline.backfill_follow(current_user.id, user_id)
     db.session.commit()
     return jsonify({"data": {"follower_id": current_user.id, "followed_id": user_id}, "message": "Followed"}), 201
 
@@ -120,33 +160,61 @@ def unfollow_user(user_id):
         return jsonify({"error": "Not following this user", "message": "Failed"}), 404
 
     db.session.delete(follow)
+    counters.bump_user(current_user.id, following_count=-1)
+    counters.bump_user(user_id, follower_count=-1)
+    timeline.prune_follow(current_user.id, user_id)
     db.session.commit()
     return jsonify({"data": None, "message": "Unfollowed"}), 200
 
 
 # ---------------------------------------------------------------------------
-# Followers list
+# Followers / following lists — keyset paginated on (follows.created_at, user id)
 # ---------------------------------------------------------------------------
 
-@user_bp.get("/<int:user_id>/followers")
-def get_followers(user_id):
-    user = db.session.get(User, user_id)
-    if not user:
+def _follow_page(user_id, listed_id, owner_id):
+    """
+    One page of the users on the listed_id side of follows whose owner_id is
+    user_id, newest follow first, each flagged with whether the current user
+    follows them. Returns a response tuple.
+    """
+    if not db.session.get(User, user_id):
         return jsonify({"error": "User not found", "message": "Failed"}), 404
+    try:
+        limit, position = get_cursor_page()
+    except ValueError:
+        return jsonify({"error": "Invalid cursor", "message": "Failed"}), 400
+
+    if current_user.is_authenticated:
+        mine = aliased(Follow)
+        followed_by_me = mine.follower_id.is_not(None)
+    else:
+        followed_by_me = literal(False)
+    query = (
+        select(User, Follow.created_at, followed_by_me)
+        .join(Follow, listed_id == User.id)
+        .where(owner_id == user_id)
+        .order_by(Follow.created_at.desc(), listed_id.desc())
+    )
+    if current_user.is_authenticated:
+        query = query.outerjoin(mine, and_(mine.follower_id == current_user.id, mine.followed_id == User.id))
+    if position:
+        query = query.where(tuple_(Follow.created_at, listed_id) < position)
+    # Fetch one extra row to learn whether another page exists
+    rows, next_cursor = trim_page(
+        db.session.execute(query.limit(limit + 1)).all(), limit, lambda row: (row[1], row[0].id)
+    )
+    users = [
+        {**user, "is_followed_by_me": is_followed}
+        for user, (_, _, is_followed) in zip(users_schema.dump([r[0] for r in rows]), rows)
+    ]
+    return jsonify({"data": {"users": users, "next_cursor": next_cursor}, "message": "Success"}), 200
 
-    followers = [f.follower for f in user.followers]
-    return jsonify({"data": users_schema.dump(followers), "message": "Success"}), 200
 
+@user_bp.get("/<int:user_id>/followers")
+def get_followers(user_id):
+    return _follow_page(user_id, Follow.follower_id, Follow.followed_id)
 
-# ---------------------------------------------------------------------------
-# Following list
-# ---------------------------------------------------------------------------
 
 @user_bp.get("/<int:user_id>/following")
 def get_following(user_id):
-    user = db.session.get(User, user_id)
-    if not user:
-        return jsonify({"error": "User not found", "message": "Failed"}), 404
-
-    following = [f.followed for f in user.following]
-    return jsonify({"data": users_schema.dump(following), "message": "Success"}), 200
+    return _follow_page(user_id, Follow.followed_id, Follow.follower_id)
@@ -20,7 +20,7 @@ class RecipePostListSchema(SQLAlchemyAutoSchema):
         load_instance = True
         sqla_session = db.session
         include_fk = True
-        exclude = ("ingredients", "steps")
+        exclude = ("ingredients", "steps", "search_vector", "ingredient_term_ids", "fanned_out")
 
 
 class RecipePostDetailSchema(SQLAlchemyAutoSchema):
@@ -44,8 +44,10 @@ class RecipePostDetailSchema(SQLAlchemyAutoSchema):
         load_instance = True
         sqla_session = db.session
         include_fk = True
+        exclude = ("search_vector", "ingredient_term_ids", "fanned_out")
 
 
 recipe_post_list_schema = RecipePostListSchema()
 recipe_posts_list_schema = RecipePostListSchema(many=True)
 recipe_post_detail_schema = RecipePostDetailSchema()
+recipe_posts_detail_schema = RecipePostDetailSchema(many=True)
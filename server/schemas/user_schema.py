@@ -1,5 +1,4 @@
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
-from marshmallow import fields
 from app import db
 from models.user import User
 
@@ -22,20 +21,7 @@ class UserBriefSchema(SQLAlchemyAutoSchema):
 
 
 class UserProfileSchema(SQLAlchemyAutoSchema):
-    """Full profile schema with computed counts."""
-    post_count = fields.Method("get_post_count", dump_only=True)
-    follower_count = fields.Method("get_follower_count", dump_only=True)
-    following_count = fields.Method("get_following_count", dump_only=True)
-
-    def get_post_count(self, obj):
-        return len(obj.posts)
-
-    def get_follower_count(self, obj):
-        return len(obj.followers)
-
-    def get_following_count(self, obj):
-        return len(obj.following)
-
+    """Full profile schema; post / follower / following counts are counter columns."""
     class Meta:
         model = User
         load_instance = True
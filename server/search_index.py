@@ -0,0 +1,103 @@
+"""
+Full-text search document for recipes.
+
+recipe_posts.search_vector is a weighted tsvector over the title (A), tag and
+ingredient names (B), description (C) and step bodies (D), backed by a GIN
+index. It is rebuilt in SQL from the current rows whenever a recipe is created
+or edited; deleting a post deletes its vector with the row.
+
+Full-text matching needs whole (stemmed) words, so titles and ingredient names
+are also matched by trigram word similarity (pg_trgm) to catch typos like
+"chiken".
+"""
+from sqlalchemy import func, literal_column, select, union, update
+
+from app import db
+from models.ingredient import Ingredient
+from models.post import Post
+from models.post_tag import PostTag
+from models.recipe_post import RecipePost
+from models.step import Step
+from models.tag import Tag
+
+TEXT_SEARCH_CONFIG = "english"
+
+_recipe_posts = RecipePost.__table__
+_posts = Post.__table__
+
+
+def _weighted(text, weight):
+    # Weight as an untyped literal so Postgres resolves it to "char"
+    return func.setweight(
+        func.to_tsvector(TEXT_SEARCH_CONFIG, func.coalesce(text, "")),
+        literal_column(f"'{weight}'"),
+    )
+
+
+def _joined(column, *where):
+    """Space-joined values of column for the recipe_posts row being updated."""
+    return (
+        select(func.string_agg(column, " "))
+        .where(*where)
+        .correlate(_recipe_posts)
+        .scalar_subquery()
+    )
+
+
+def _search_document():
+    tag_names = _joined(Tag.name, PostTag.tag_id == Tag.id, PostTag.post_id == _recipe_posts.c.id)
+    ingredient_names = _joined(Ingredient.name, Ingredient.recipe_post_id == _recipe_posts.c.id)
+    step_bodies = _joined(Step.body, Step.recipe_post_id == _recipe_posts.c.id)
+    return (
+        _weighted(_recipe_posts.c.title, "A")
+        .op("||")(_weighted(tag_names, "B"))
+        .op("||")(_weighted(ingredient_names, "B"))
+        .op("||")(_weighted(_posts.c.description, "C"))
+        .op("||")(_weighted(step_bodies, "D"))
+    )
+
+
+def _reindex(*where):
+    db.session.flush()  # the document is built from rows pending in this session
+    db.session.execute(
+        update(_recipe_posts)
+        .values(search_vector=_search_document())
+        .where(_recipe_posts.c.id == _posts.c.id, *where)
+    )
+
+
+def reindex_post(post_id):
+    """Rebuild one recipe's search document after it was created or edited."""
+    _reindex(_recipe_posts.c.id == post_id)
+
+
+def reindex_all():
+    _reindex()
+
+
+def websearch_query(q):
+    """Parse user input with websearch_to_tsquery: quoted phrases, OR, -exclusions."""
+    return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, q)
+
+
+def rank(tsquery):
+    return func.ts_rank(RecipePost.search_vector, tsquery)
+
+
+def matching_ids(q):
+    """
+    Ids of recipes matching q by full text, or by trigram word similarity on
+    the title or an ingredient name. Each branch is served by its own GIN index.
+    """
+    tsquery = websearch_query(q)
+    return union(
+        select(_recipe_posts.c.id).where(_recipe_posts.c.search_vector.op("@@")(tsquery)),
+        # `col %> q` is word_similarity(q, col) above pg_trgm's threshold
+        select(_recipe_posts.c.id).where(_recipe_posts.c.title.op("%>")(q)),
+        select(Ingredient.recipe_post_id).where(Ingredient.name.op("%>")(q)),
+    )
+
+
+def relevance(q):
+    """Ranking for matching_ids(q): text rank plus how closely the title matches."""
+    return func.coalesce(rank(websearch_query(q)), 0) + func.word_similarity(q, RecipePost.title)
@@ -18,6 +18,17 @@ from models.recipe_box import RecipeBox
 from models.box_post import BoxPost
 from models.comment import Comment
 from models.follow import Follow
+from models.timeline_entry import TimelineEntry
+from models.ingredient_term import IngredientTerm
+from models.post_daily_stat import PostDailyStat
+from models.trending_rank import TrendingRank
+from models.user_suggestion import UserSuggestion
+import counters
+import follow_suggestions
+import pantry
+import search_index
+import timeline
+import trending
 
 from seed_data.users import USERS
 from seed_data.tags import TAGS
@@ -34,6 +45,10 @@ app = create_app()
 def clear_data():
     """Delete all rows in a safe order (respect FK constraints)."""
     print("Clearing existing data...")
+    TimelineEntry.query.delete()
+    TrendingRank.query.delete()
+    UserSuggestion.query.delete()
+    PostDailyStat.query.delete()
     Follow.query.delete()
     BoxPost.query.delete()
     PostTag.query.delete()
@@ -43,6 +58,7 @@ def clear_data():
     RecipeBox.query.delete()
     RecipePost.query.delete()
     Post.query.delete()
+    IngredientTerm.query.delete()
     Tag.query.delete()
     User.query.delete()
     db.session.commit()
@@ -252,6 +268,26 @@ def main():
         print("Seeding follows, box saves, comments...")
         seed_social(users_map, posts_map)
 
+        print("Counting saves, cooks, comments, forks and follows...")
+        db.session.flush()
+        counters.reconcile_posts()
+        counters.reconcile_users()
+
+        print("Building feed timelines...")
+        timeline.rebuild_all()
+
+        print("Indexing recipes for search...")
+        search_index.reindex_all()
+
+        print("Indexing recipe ingredients for pantry search...")
+        pantry.reindex_all()
+
+        print("Building Explore leaderboards...")
+        trending.refresh(full=True)
+
+        print("Computing follow suggestions...")
+        follow_suggestions.refresh()
+
         db.session.commit()
 
         print("\nDone! Database seeded successfully.")
@@ -0,0 +1,283 @@
+"""
+In-process prefix index for search-as-you-type suggestions.
+
+Holds tag names, distinct ingredient names, recipe titles and users in one
+sorted array of (term, key) pairs; a lookup bisects to the first term with
+the typed prefix, walks the terms sharing it and keeps the heaviest matches,
+so it never touches the database. Every word start of a label is indexed, so
+"chi" finds "Green Chicken Curry".
+
+Each worker process builds its own copy in a background thread, started on
+the first lookup, and rebuilds it every SUGGEST_INDEX_TTL seconds; a finished
+build replaces the old index in one assignment, so lookups never wait on the
+database. Until the first build lands, lookups return no suggestions.
+
+Between rebuilds, the write paths (create / update / delete post, register,
+profile edits) patch the index incrementally. Patches made while a rebuild
+is running are replayed onto the new index before it's swapped in (if the
+build already saw one, a usage count can be one off until the next rebuild);
+changes made by other workers show up at that worker's next rebuild.
+"""
+import bisect
+import heapq
+import os
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import func, select
+
+from app import db
+from models.box_post import BoxPost
+from models.ingredient import Ingredient
+from models.post_tag import PostTag
+from models.recipe_post import RecipePost
+from models.tag import Tag
+from models.user import User
+
+SUGGESTION_TYPES = ("tag", "ingredient", "recipe", "user")
+
+
+def normalize(text):
+    return " ".join((text or "").lower().split())
+
+
+def _word_starts(label):
+    """'Green Chicken Curry' -> ['green chicken curry', 'chicken curry', 'curry']"""
+    words = normalize(label).split(" ")
+    return [" ".join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+class PrefixIndex:
+    def __init__(self, items=()):
+        """
+        Build from (key, entry, labels) triples. All (term, key) pairs are
+        collected and sorted once; put() is for incremental changes.
+        """
+        self._terms = []     # sorted [(term, key)]
+        self._entries = {}   # key -> suggestion dict
+        self._keys_terms = {}  # key -> terms it was indexed under
+        for key, entry, labels in items:
+            terms = sorted({t for label in labels for t in _word_starts(label)})
+            self._terms.extend((term, key) for term in terms)
+            self._entries[key] = entry
+            self._keys_terms[key] = terms
+        self._terms.sort()
+
+    def put(self, key, entry, labels):
+        """Insert or replace the suggestion stored under key."""
+        self.discard(key)
+        terms = sorted({t for label in labels for t in _word_starts(label)})
+        for term in terms:
+            bisect.insort(self._terms, (term, key))
+        self._entries[key] = entry
+        self._keys_terms[key] = terms
+
+    def discard(self, key):
+        for term in self._keys_terms.pop(key, ()):
+            i = bisect.bisect_left(self._terms, (term, key))
+            if i < len(self._terms) and self._terms[i] == (term, key):
+                del self._terms[i]
+        self._entries.pop(key, None)
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def search(self, prefix, limit, types=SUGGESTION_TYPES):
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        found = {}
+        i = bisect.bisect_left(self._terms, (prefix,))
+        while i < len(self._terms) and self._terms[i][0].startswith(prefix):
+            key = self._terms[i][1]
+            if key[0] in types:
+                found[key] = self._entries[key]
+            i += 1
+        return heapq.nsmallest(limit, found.values(), key=lambda e: (-e["weight"], e["label"]))
+
+
+_lock = threading.Lock()
+_index = None
+# Patches made while a rebuild runs, replayed onto the new index; None when idle
+_pending = None
+_builder_pid = None
+
+
+def _recipe_entry(post_id, title, author, weight):
+    return {"type": "recipe", "id": post_id, "label": title, "author": author, "weight": weight}
+
+
+def _build():
+    items = []
+
+    tag_rows = db.session.execute(
+        select(Tag.id, Tag.name, func.count(PostTag.post_id))
+        .outerjoin(PostTag, PostTag.tag_id == Tag.id)
+        .group_by(Tag.id, Tag.name)
+    )
+    for tag_id, name, uses in tag_rows:
+        items.append((("tag", name), {"type": "tag", "id": tag_id, "label": name, "weight": uses}, [name]))
+
+    name = func.lower(func.trim(Ingredient.name))
+    ingredient_rows = db.session.execute(
+        select(name, func.count(func.distinct(Ingredient.recipe_post_id))).group_by(name)
+    )
+    for ingredient, uses in ingredient_rows:
+        if ingredient:
+            items.append((("ingredient", ingredient),
+                          {"type": "ingredient", "id": None, "label": ingredient, "weight": uses}, [ingredient]))
+
+    saves = (
+        select(BoxPost.post_id, func.count().label("n"))
+        .group_by(BoxPost.post_id)
+        .subquery()
+    )
+    recipe_rows = db.session.execute(
+        select(RecipePost.id, RecipePost.title, User.display_name, func.coalesce(saves.c.n, 0))
+        .join(User, User.id == RecipePost.user_id)
+        .outerjoin(saves, saves.c.post_id == RecipePost.id)
+    )
+    for post_id, title, author, weight in recipe_rows:
+        items.append((("recipe", post_id), _recipe_entry(post_id, title, author, weight), [title]))
+
+    user_rows = db.session.execute(
+        select(User.id, User.username, User.display_name, User.follower_count)
+    )
+    for user_id, username, display_name, weight in user_rows:
+        items.append((("user", user_id),
+                      {"type": "user", "id": user_id, "label": display_name, "username": username, "weight": weight},
+                      [username, display_name]))
+
+    return PrefixIndex(items)
+
+
+def rebuild():
+    """Build a fresh index from the database and swap it in."""
+    global _index, _pending
+    with _lock:
+        _pending = []
+    try:
+        index = _build()
+    except Exception:
+        with _lock:
+            _pending = None
+        raise
+    with _lock:
+        for apply, args in _pending:
+            apply(index, *args)
+        _pending = None
+        _index = index
+
+
+def _refresh(app):
+    while True:
+        with app.app_context():
+            try:
+                rebuild()
+            except Exception:
+                app.logger.exception("Rebuilding the suggestion index failed")
+            finally:
+                db.session.remove()
+        time.sleep(app.config["SUGGEST_INDEX_TTL"])
+
+
+def _start_refresh():
+    # Keyed on the pid so a forked worker starts its own thread
+    global _builder_pid
+    with _lock:
+        if _builder_pid == os.getpid():
+            return
+        _builder_pid = os.getpid()
+    app = current_app._get_current_object()
+    threading.Thread(target=_refresh, args=(app,), name="suggest-index", daemon=True).start()
+
+
+def suggest(prefix, limit, types=SUGGESTION_TYPES):
+    """Return up to limit suggestions for prefix, most popular first."""
+    _start_refresh()
+    # Under the lock: incremental patches change the live index in place
+    with _lock:
+        return _index.search(prefix, limit, types) if _index else []
+
+
+# ---------------------------------------------------------------------------
+# Incremental updates — no-ops until this worker starts building its index
+# ---------------------------------------------------------------------------
+
+def is_built():
+    return _index is not None or _pending is not None
+
+
+def recipe_snapshot(recipe_post):
+    """Capture what the index holds for a recipe, to diff against after an edit."""
+    return {
+        "id": recipe_post.id,
+        "title": recipe_post.title,
+        "author": recipe_post.user.display_name,
+        "ingredients": {normalize(i.name) for i in recipe_post.ingredients if normalize(i.name)},
+        "tags": {(pt.tag.id, pt.tag.name) for pt in recipe_post.tags},
+    }
+
+
+def _patch(apply, *args):
+    """Apply a change to the live index and queue it for a rebuild in flight."""
+    with _lock:
+        if _index is not None:
+            apply(_index, *args)
+        if _pending is not None:
+            _pending.append((apply, args))
+
+
+def _bump(index, key, entry, delta):
+    existing = index.get(key)
+    weight = (existing["weight"] if existing else 0) + delta
+    if weight <= 0:
+        index.discard(key)
+    elif existing:
+        existing["weight"] = weight
+    else:
+        index.put(key, {**entry, "weight": weight}, [entry["label"]])
+
+
+def _apply_recipe(index, before, after):
+    old_ingredients = before["ingredients"] if before else set()
+    new_ingredients = after["ingredients"] if after else set()
+    for name in new_ingredients - old_ingredients:
+        _bump(index, ("ingredient", name), {"type": "ingredient", "id": None, "label": name}, 1)
+    for name in old_ingredients - new_ingredients:
+        _bump(index, ("ingredient", name), {"type": "ingredient", "id": None, "label": name}, -1)
+
+    old_tags = before["tags"] if before else set()
+    new_tags = after["tags"] if after else set()
+    for tag_id, name in new_tags - old_tags:
+        _bump(index, ("tag", name), {"type": "tag", "id": tag_id, "label": name}, 1)
+    for tag_id, name in old_tags - new_tags:
+        existing = index.get(("tag", name))
+        if existing:  # tags stay suggestible at zero uses, like a fresh build
+            existing["weight"] = max(existing["weight"] - 1, 0)
+
+    if after:
+        key = ("recipe", after["id"])
+        weight = index.get(key)["weight"] if index.get(key) else 0
+        index.put(key, _recipe_entry(after["id"], after["title"], after["author"], weight), [after["title"]])
+    elif before:
+        index.discard(("recipe", before["id"]))
+
+
+def _apply_user(index, user_id, username, display_name):
+    key = ("user", user_id)
+    weight = index.get(key)["weight"] if index.get(key) else 0
+    index.put(key,
+              {"type": "user", "id": user_id, "label": display_name, "username": username, "weight": weight},
+              [username, display_name])
+
+
+def update_recipe(before=None, after=None):
+    """Apply a recipe create (after only), edit (both) or delete (before only)."""
+    _patch(_apply_recipe, before, after)
+
+
+def update_user(user):
+    """Add a new user or re-index one whose names changed."""
+    _patch(_apply_user, user.id, user.username, user.display_name)
@@ -0,0 +1,139 @@
+"""
+Test app on a throwaway SQLite database.
+
+Production runs on PostgreSQL; the handful of Postgres-only pieces the tested
+endpoints touch are mapped onto SQLite here: tsvector / int[] columns are
+stored as TEXT, now() keeps microseconds, the full-text functions are plain
+Python stand-ins, lists bind as JSON and a VALUES list renders as a UNION ALL
+of SELECTs. Endpoints built on other Postgres features (GROUPING SETS,
+LATERAL, DISTINCT ON, DELETE ... USING, array overlap, full-text / trigram
+operators) aren't exercised here.
+"""
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+
+import pytest
+
+_db_file = tempfile.NamedTemporaryFile(prefix="cookbook-test-", suffix=".db", delete=False)
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_file.name}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, literal  # noqa: E402
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+from sqlalchemy.sql.expression import Values  # noqa: E402
+from sqlalchemy.sql.functions import now  # noqa: E402
+
+from app import create_app, db, limiter  # noqa: E402
+
+
+@compiles(TSVECTOR, "sqlite")
+@compiles(ARRAY, "sqlite")
+def _as_text(type_, compiler, **kw):
+    return "TEXT"
+
+
+@compiles(now, "sqlite")
+def _now_with_microseconds(element, compiler, **kw):
+    # CURRENT_TIMESTAMP has whole seconds, which would make keyset cursors
+    # compare stored timestamps against bound ones with a fractional part
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(Values, "sqlite")
+def _values_as_union(element, compiler, asfrom=False, **kw):
+    selects = [
+        "SELECT " + ", ".join(
+            f"{compiler.process(literal(value, column.type), **kw)} AS {column.name}"
+            for value, column in zip(row, element.columns)
+        )
+        for rows in element._data
+        for row in rows
+    ]
+    sql = "(" + " UNION ALL ".join(selects) + ")"
+    return f"{sql} AS {element.name}" if asfrom and element.name else sql
+
+
+class _StringAgg:
+    def __init__(self):
+        self.values = []
+
+    def step(self, value, separator):
+        if value is not None:
+            self.values.append(value)
+
+    def finalize(self):
+        return " ".join(self.values) if self.values else None
+
+
+sqlite3.register_adapter(list, json.dumps)
+
+
+@event.listens_for(Engine, "connect")
+def _sqlite_functions(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_aggregate("string_agg", 2, _StringAgg)
+        dbapi_connection.create_function("to_tsvector", 2, lambda config, text: (text or "").lower())
+        dbapi_connection.create_function("setweight", 2, lambda vector, weight: vector)
+
+
+_app = create_app()
+_app.config.update(TESTING=True, RATELIMIT_ENABLED=False)
+limiter.enabled = False
+
+
+@pytest.fixture
+def app():
+    with _app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.remove()
+    yield _app
+
+
+@pytest.fixture
+def queries(app):
+    """List of SQL statements executed, cleared with queries.clear()."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def make_client(app):
+    """make_client("alice") registers alice and returns a logged-in test client."""
+    def make(username):
+        client = app.test_client()
+        response = client.post("/api/auth/register", json={
+            "email": f"{username}@example.com",
+            "username": username,
+            "display_name": username.title(),
+            "password": "password123",
+        })
+        assert response.status_code == 201, response.get_json()
+        client.user_id = response.get_json()["data"]["id"]
+        return client
+    return make
+
+
+def create_recipe(client, title="Soup", **fields):
+    response = client.post("/api/posts/recipe", json={"title": title, "self_rating": 4, **fields})
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()["data"]["id"]
+
+
+def box_id(app, user_id, box_type):
+    from models.recipe_box import RecipeBox
+    with app.app_context():
+        return RecipeBox.query.filter_by(user_id=user_id, box_type=box_type).one().id
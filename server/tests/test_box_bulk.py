@@ -0,0 +1,14 @@
+from conftest import box_id, create_recipe
+
+
+def test_bulk_rejects_boolean_ids(app, make_client):
+    cook = make_client("cook")
+    post_id = create_recipe(cook, "Stew")
+    box = box_id(app, cook.user_id, "want_to_try")
+    response = cook.post("/api/boxes/bulk", json={"operations": [
+        {"post_id": True, "box_id": box, "action": "save"},
+        {"post_id": post_id, "box_id": True, "action": "save"},
+        {"post_id": post_id, "box_id": box, "action": "save"},
+    ]})
+    assert response.status_code == 200
+    assert [result["status"] for result in response.get_json()["data"]] == [400, 400, 201]
@@ -0,0 +1,41 @@
+"""List endpoints run a fixed number of queries however many cards they return."""
+import pytest
+
+from conftest import box_id, create_recipe
+
+
+@pytest.fixture
+def reader(app, make_client):
+    author = make_client("author")
+    reader = make_client("reader")
+    reader.post(f"/api/users/{author.user_id}/follow")
+    reader.box_id = box_id(app, reader.user_id, "want_to_try")
+    reader.author_id = author.user_id
+    for i in range(12):
+        post_id = create_recipe(author, f"Soup {i}", tags=[{"name": "thai", "category": "cuisine"}])
+        reader.post(f"/api/posts/{post_id}/save", json={"box_id": reader.box_id})
+    return reader
+
+
+def _count(client, queries, url):
+    queries.clear()
+    response = client.get(url)
+    assert response.status_code == 200, response.get_json()
+    data = response.get_json()["data"]
+    posts = data["posts"] if isinstance(data, dict) else data
+    return len(posts), len(queries)
+
+
+@pytest.mark.parametrize("url", [
+    "/api/posts/feed?limit={n}",
+    "/api/posts/feed?cursor=&limit={n}",
+    "/api/search/tags?tag=thai&limit={n}",
+    "/api/users/{author}/posts?limit={n}",
+    "/api/boxes/{box}?limit={n}",
+    "/api/boxes/{box}?cursor=&limit={n}",
+])
+def test_query_count_does_not_grow_with_page_size(reader, queries, url):
+    small = _count(reader, queries, url.format(n=2, author=reader.author_id, box=reader.box_id))
+    large = _count(reader, queries, url.format(n=10, author=reader.author_id, box=reader.box_id))
+    assert (small[0], large[0]) == (2, 10)
+    assert small[1] == large[1]
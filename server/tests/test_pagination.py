@@ -0,0 +1,108 @@
+"""Out-of-range page sizes are clamped instead of failing."""
+import pytest
+
+import follow_suggestions
+from conftest import box_id, create_recipe
+
+
+@pytest.fixture
+def reader(make_client):
+    author = make_client("author")
+    reader = make_client("reader")
+    reader.post(f"/api/users/{author.user_id}/follow")
+    for i in range(3):
+        create_recipe(author, f"Soup {i}")
+    return reader
+
+
+@pytest.mark.parametrize("limit", ["0", "-3"])
+def test_feed_cursor_mode_clamps_limit(reader, limit):
+    response = reader.get(f"/api/posts/feed?cursor=&limit={limit}")
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert len(data["posts"]) == 1
+    assert data["next_cursor"]
+
+
+def test_feed_offset_mode_clamps_limit(reader):
+    response = reader.get("/api/posts/feed?limit=0")
+    assert response.status_code == 200
+    assert len(response.get_json()["data"]) == 1
+
+
+def test_feed_cursor_walks_every_post_once(reader):
+    titles, cursor = [], ""
+    while True:
+        data = reader.get(f"/api/posts/feed?cursor={cursor}&limit=2").get_json()["data"]
+        titles += [post["title"] for post in data["posts"]]
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    assert titles == ["Soup 2", "Soup 1", "Soup 0"]
+
+
+@pytest.fixture
+def box(app, make_client):
+    owner = make_client("owner")
+    owner.box_id = box_id(app, owner.user_id, "want_to_try")
+    for i in range(3):
+        post_id = create_recipe(owner, f"Stew {i}")
+        owner.post(f"/api/posts/{post_id}/save", json={"box_id": owner.box_id})
+    return owner
+
+
+@pytest.mark.parametrize("query", ["limit=0", "limit=-3", "cursor=&limit=0", "offset=1&limit=0"])
+def test_box_clamps_limit(box, query):
+    response = box.get(f"/api/boxes/{box.box_id}?{query}")
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert len(data["posts"]) == 1
+    assert data["next_cursor"]
+
+
+def test_box_cursor_walks_every_post_once(box):
+    titles, cursor = [], ""
+    while True:
+        data = box.get(f"/api/boxes/{box.box_id}?cursor={cursor}&limit=2").get_json()["data"]
+        titles += [post["title"] for post in data["posts"]]
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    assert titles == ["Stew 2", "Stew 1", "Stew 0"]
+
+
+@pytest.fixture
+def followed(make_client):
+    star = make_client("star")
+    for name in ("fan1", "fan2", "fan3"):
+        make_client(name).post(f"/api/users/{star.user_id}/follow")
+    return star
+
+
+@pytest.mark.parametrize("limit", ["0", "-3"])
+def test_followers_clamp_limit(followed, limit):
+    response = followed.get(f"/api/users/{followed.user_id}/followers?cursor=&limit={limit}")
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert len(data["users"]) == 1
+    assert data["next_cursor"]
+
+
+def test_followers_cursor_walks_every_follower_once(followed):
+    names, cursor = [], ""
+    while True:
+        data = followed.get(f"/api/users/{followed.user_id}/followers?cursor={cursor}&limit=2").get_json()["data"]
+        names += [user["username"] for user in data["users"]]
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    assert names == ["fan3", "fan2", "fan1"]
+
+
+@pytest.mark.parametrize("limit, expected", [("0", 1), ("-1", 1), ("50", 20)])
+def test_follow_suggestions_clamp_limit(make_client, monkeypatch, limit, expected):
+    asked = []
+    monkeypatch.setattr(follow_suggestions, "suggestions_for", lambda user_id, n: asked.append(n) or [])
+    response = make_client("newcomer").get(f"/api/users/suggestions?limit={limit}")
+    assert response.status_code == 200
+    assert asked == [expected]
@@ -0,0 +1,44 @@
+"""A cached post detail is refreshed when a post nested in it changes."""
+import pytest
+
+from conftest import create_recipe
+
+
+@pytest.fixture
+def fork(make_client):
+    original_author = make_client("original")
+    source_id = create_recipe(original_author, "Ragu")
+    forker = make_client("forker")
+    fork_id = create_recipe(forker, "Quick Ragu", source_type="internal", source_post_id=source_id)
+    first = forker.get(f"/api/posts/{fork_id}")
+    assert first.get_json()["data"]["source_post"]["title"] == "Ragu"
+    return original_author, forker, source_id, fork_id
+
+
+def test_source_post_edit_changes_detail(fork):
+    original_author, forker, source_id, fork_id = fork
+    etag = forker.get(f"/api/posts/{fork_id}").headers["ETag"]
+    original_author.patch(f"/api/posts/{source_id}", json={"title": "Nonna's Ragu"})
+    response = forker.get(f"/api/posts/{fork_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json()["data"]["source_post"]["title"] == "Nonna's Ragu"
+
+
+def test_source_author_edit_changes_detail(fork):
+    original_author, forker, source_id, fork_id = fork
+    original_author.patch(f"/api/users/{original_author.user_id}", json={"display_name": "Nonna"})
+    data = forker.get(f"/api/posts/{fork_id}").get_json()["data"]
+    assert data["source_post"]["user"]["display_name"] == "Nonna"
+
+
+def test_unchanged_detail_revalidates(fork):
+    _, forker, _, fork_id = fork
+    etag = forker.get(f"/api/posts/{fork_id}").headers["ETag"]
+    assert forker.get(f"/api/posts/{fork_id}", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_detail_has_no_last_modified(fork):
+    _, forker, _, fork_id = fork
+    response = forker.get(f"/api/posts/{fork_id}")
+    assert "Last-Modified" not in response.headers
+    assert response.headers["ETag"]
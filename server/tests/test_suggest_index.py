@@ -0,0 +1,46 @@
+import suggest_index
+from suggest_index import PrefixIndex
+
+from conftest import create_recipe
+
+
+def _recipe(post_id, title, weight):
+    return ("recipe", post_id), {"type": "recipe", "id": post_id, "label": title, "weight": weight}, [title]
+
+
+def test_build_matches_incremental_puts():
+    items = [_recipe(1, "Green Chicken Curry", 3), _recipe(2, "Chili", 5), _recipe(3, "Curry Laksa", 1)]
+    built = PrefixIndex(items)
+    incremental = PrefixIndex()
+    for item in items:
+        incremental.put(*item)
+    assert built._terms == incremental._terms
+    assert [e["id"] for e in built.search("c", 10)] == [2, 1, 3]
+
+
+def test_search_ranks_the_whole_prefix_range():
+    # The heaviest match sorts last alphabetically, behind thousands of others
+    items = [_recipe(i, f"Apple {i:05d}", 1) for i in range(5000)]
+    items.append(_recipe(9999, "Azuki Bean Soup", 50))
+    index = PrefixIndex(items)
+    assert index.search("a", 1)[0]["id"] == 9999
+
+
+def test_rebuild_replays_changes_made_while_building(app, make_client, monkeypatch):
+    client = make_client("cook")
+    create_recipe(client, "Tomato Soup")
+    build = suggest_index._build
+
+    def build_then_create():
+        index = build()
+        suggest_index.update_recipe(after={
+            "id": 999, "title": "Tomato Tart", "author": "Cook", "ingredients": {"tomato"}, "tags": set(),
+        })
+        return index
+
+    monkeypatch.setattr(suggest_index, "_index", None)
+    monkeypatch.setattr(suggest_index, "_build", build_then_create)
+    with app.app_context():
+        suggest_index.rebuild()
+    labels = {e["label"] for e in suggest_index._index.search("tomato", 10)}
+    assert labels == {"Tomato Soup", "Tomato Tart", "tomato"}
@@ -0,0 +1,44 @@
+"""Posts stay in feeds whichever side of the fan-out limit their author is on later."""
+import pytest
+
+from conftest import create_recipe
+
+
+@pytest.fixture
+def limit_one(app, monkeypatch):
+    monkeypatch.setitem(app.config, "FEED_FANOUT_MAX_FOLLOWERS", 1)
+
+
+def _feed_titles(client):
+    response = client.get("/api/posts/feed?cursor=&limit=20")
+    return [post["title"] for post in response.get_json()["data"]["posts"]]
+
+
+def test_post_made_over_limit_stays_after_author_drops_under(limit_one, make_client):
+    author = make_client("author")
+    stays, leaves = make_client("stays"), make_client("leaves")
+    for follower in (stays, leaves):
+        follower.post(f"/api/users/{author.user_id}/follow")
+    create_recipe(author, "Read Merged")
+    leaves.delete(f"/api/users/{author.user_id}/follow")
+    assert _feed_titles(stays) == ["Read Merged"]
+
+
+def test_new_follower_gets_posts_fanned_out_under_limit(limit_one, make_client):
+    author = make_client("author")
+    first = make_client("first")
+    first.post(f"/api/users/{author.user_id}/follow")
+    create_recipe(author, "Fanned Out")
+    make_client("second").post(f"/api/users/{author.user_id}/follow")
+    create_recipe(author, "Read Merged")
+    third = make_client("third")
+    third.post(f"/api/users/{author.user_id}/follow")
+    assert _feed_titles(third) == ["Read Merged", "Fanned Out"]
+    assert _feed_titles(first) == ["Read Merged", "Fanned Out"]
+
+
+def test_fanned_out_flag_stays_internal(make_client):
+    author = make_client("author")
+    post_id = create_recipe(author, "Soup")
+    assert "fanned_out" not in author.get(f"/api/posts/{post_id}").get_json()["data"]
+    assert "fanned_out" not in author.get(f"/api/users/{author.user_id}/posts").get_json()["data"][0]
@@ -0,0 +1,102 @@
+"""
+Fan-out-on-write home timelines.
+
+Each post is copied into `timeline_entries` for every follower of its author
+when it is created, so reading a feed is one range scan on
+(user_id, created_at, post_id). Posts by authors with more than
+FEED_FANOUT_MAX_FOLLOWERS followers are skipped on write — writing one row per
+follower would stall the create request — and marked fanned_out = false;
+feed_rows() merges those posts in at read time instead.
+
+The choice is recorded per post when it's created, so a post keeps its place
+in feeds when its author's follower count later crosses the limit either way.
+"""
+from flask import current_app
+from sqlalchemy import delete, insert, literal, select, update
+
+from app import db
+from models.follow import Follow
+from models.post import Post
+from models.timeline_entry import TimelineEntry
+from models.user import User
+
+_COLUMNS = ["user_id", "post_id", "created_at"]
+
+
+def _fanout_limit():
+    return current_app.config["FEED_FANOUT_MAX_FOLLOWERS"]
+
+
+def is_fanout_on_read(author_id):
+    """True if the author has too many followers to fan out on write."""
+    follower_count = db.session.scalar(select(User.follower_count).where(User.id == author_id))
+    return (follower_count or 0) > _fanout_limit()
+
+
+def fan_out_post(post_id, author_id):
+    """Copy a newly created post into each follower's timeline."""
+    if is_fanout_on_read(author_id):
+        db.session.execute(
+            update(Post).where(Post.id == post_id).values(fanned_out=False, updated_at=Post.updated_at)
+        )
+        return
+    rows = (
+        select(Follow.follower_id, Post.id, Post.created_at)
+        .join(Post, Post.user_id == Follow.followed_id)
+        .where(Post.id == post_id)
+    )
+    db.session.execute(insert(TimelineEntry).from_select(_COLUMNS, rows))
+
+
+def remove_post(post_id):
+    db.session.execute(delete(TimelineEntry).where(TimelineEntry.post_id == post_id))
+
+
+def backfill_follow(follower_id, followed_id):
+    """Copy the followed user's fanned-out posts into the new follower's timeline."""
+    rows = (
+        select(literal(follower_id, db.Integer), Post.id, Post.created_at)
+        .where(Post.user_id == followed_id, Post.fanned_out)
+    )
+    db.session.execute(insert(TimelineEntry).from_select(_COLUMNS, rows))
+
+
+def prune_follow(follower_id, followed_id):
+    """Drop the unfollowed user's posts from the follower's timeline."""
+    db.session.execute(
+        delete(TimelineEntry).where(
+            TimelineEntry.user_id == follower_id,
+            TimelineEntry.post_id.in_(select(Post.id).where(Post.user_id == followed_id)),
+        )
+    )
+
+
+def feed_rows(user_id):
+    """
+    Return a subquery of (post_id, created_at) rows making up a reader's feed:
+    their materialized timeline plus followed authors' posts that weren't
+    fanned out, read directly from `posts`.
+    """
+    timeline = (
+        select(TimelineEntry.post_id.label("post_id"), TimelineEntry.created_at.label("created_at"))
+        .where(TimelineEntry.user_id == user_id)
+    )
+    # UNION ALL: timeline rows only ever point at fanned-out posts
+    on_read = (
+        select(Post.id.label("post_id"), Post.created_at.label("created_at"))
+        .join(Follow, Follow.followed_id == Post.user_id)
+        .where(Follow.follower_id == user_id, ~Post.fanned_out)
+    )
+    return timeline.union_all(on_read).subquery()
+
+
+def rebuild_all():
+    """Rebuild every timeline from follows + posts. Returns the number of rows written."""
+    db.session.execute(delete(TimelineEntry))
+    rows = (
+        select(Follow.follower_id, Post.id, Post.created_at)
+        .join(Post, Post.user_id == Follow.followed_id)
+        .where(Post.fanned_out)
+    )
+    result = db.session.execute(insert(TimelineEntry).from_select(_COLUMNS, rows))
+    return result.rowcount
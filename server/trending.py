@@ -0,0 +1,100 @@
+"""
+Precomputed Explore leaderboards.
+
+post_daily_stats rolls box_posts up into per-post, per-day save and cook
+counts; trending_ranks holds the top TOP_N posts per metric for each window in
+WINDOWS, ranked from those rollups. Both are rebuilt by refresh(), which
+`flask trending refresh` runs on a schedule, so Explore reads a few
+precomputed rows for any window instead of aggregating box_posts per request.
+
+Rankings are as fresh as the last refresh. An incremental refresh re-rolls
+only the last LOOKBACK_DAYS days; unsaves of older saves are picked up by the
+next full refresh.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import cast, delete, func, insert, literal, select
+
+from app import db
+from models.box_post import BoxPost
+from models.post_daily_stat import PostDailyStat
+from models.recipe_box import RecipeBox
+from models.trending_rank import TrendingRank
+
+WINDOWS = (7, 30, 365)
+# metric -> PostDailyStat column it ranks by
+METRICS = {"saves": "save_count", "cooks": "cook_count"}
+TOP_N = 50
+LOOKBACK_DAYS = 2
+
+
+def _refresh_daily_stats(full):
+    since = None if full else datetime.utcnow().date() - timedelta(days=LOOKBACK_DAYS - 1)
+
+    clear = delete(PostDailyStat)
+    day = func.date(BoxPost.added_at)
+    rows = (
+        select(
+            BoxPost.post_id,
+            day,
+            func.count(),
+            func.count().filter(RecipeBox.box_type == "cooked"),
+        )
+        .join(RecipeBox, RecipeBox.id == BoxPost.box_id)
+        .group_by(BoxPost.post_id, day)
+    )
+    if since:
+        clear = clear.where(PostDailyStat.day >= since)
+        rows = rows.where(BoxPost.added_at >= datetime.combine(since, datetime.min.time()))
+
+    db.session.execute(clear)
+    result = db.session.execute(
+        insert(PostDailyStat).from_select(["post_id", "day", "save_count", "cook_count"], rows)
+    )
+    return result.rowcount
+
+
+def _refresh_ranks():
+    today = datetime.utcnow().date()
+    db.session.execute(delete(TrendingRank))
+    written = 0
+    for window_days in WINDOWS:
+        for metric, column in METRICS.items():
+            score = func.sum(getattr(PostDailyStat, column))
+            ordering = (score.desc(), PostDailyStat.post_id.desc())
+            rows = (
+                select(
+                    literal(window_days, db.Integer),
+                    cast(literal(metric), TrendingRank.metric.type),
+                    func.row_number().over(order_by=ordering),
+                    PostDailyStat.post_id,
+                    score,
+                )
+                .where(PostDailyStat.day > today - timedelta(days=window_days))
+                .group_by(PostDailyStat.post_id)
+                .having(score > 0)
+                .order_by(*ordering)
+                .limit(TOP_N)
+            )
+            result = db.session.execute(
+                insert(TrendingRank).from_select(["window_days", "metric", "rank", "post_id", "score"], rows)
+            )
+            written += result.rowcount
+    return written
+
+
+def refresh(full=False):
+    """Re-roll daily stats and rebuild every leaderboard. Returns (stat rows, rank rows)."""
+    stats = _refresh_daily_stats(full)
+    ranks = _refresh_ranks()
+    return stats, ranks
+
+
+def top_post_ids(metric, window_days, limit):
+    """Post ids of a leaderboard, best first."""
+    return db.session.scalars(
+        select(TrendingRank.post_id)
+        .where(TrendingRank.window_days == window_days, TrendingRank.metric == metric)
+        .order_by(TrendingRank.rank)
+        .limit(limit)
+    ).all()
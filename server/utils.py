@@ -1,11 +1,81 @@
+import base64
+import binascii
+from datetime import datetime
+
 from flask import request
 
 
 def get_pagination():
-    """Return (limit, offset) from query params; caps limit at 100."""
+    """Return (limit, offset) from query params; limit is kept within 1-100."""
     try:
-        limit = min(int(request.args.get("limit", 20)), 100)
+        limit = min(max(int(request.args.get("limit", 20)), 1), 100)
         offset = max(int(request.args.get("offset", 0)), 0)
     except (ValueError, TypeError):
         limit, offset = 20, 0
     return limit, offset
+
+
+def encode_cursor(created_at, row_id):
+    """Pack a (created_at, id) keyset position into an opaque URL-safe token."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """
+    Unpack a token from encode_cursor() into (created_at, id).
+    Raises ValueError if the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_raw, id_raw = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+        return datetime.fromisoformat(created_raw), int(id_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def get_cursor_page():
+    """
+    Return (limit, position) for keyset pagination from ?cursor= / ?limit=.
+    position is None for the first page (empty cursor).
+    Raises ValueError on a malformed cursor.
+    """
+    try:
+        limit = min(max(int(request.args.get("limit", 20)), 1), 100)
+    except (ValueError, TypeError):
+        limit = 20
+    token = request.args.get("cursor", "")
+    return limit, (decode_cursor(token) if token else None)
+
+
+def trim_page(rows, limit, position_of):
+    """
+    Split rows fetched with LIMIT limit + 1 into (page, next_cursor).
+    position_of(row) gives a row's (created_at, id) keyset position;
+    next_cursor is None on the last page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(*position_of(page[-1]))
+
+
+def parse_id_list(name="ids", max_ids=100):
+    """
+    Return the unique integer ids in a comma-separated ?name= param, in order.
+    Raises ValueError if an id is not an integer or there are more than max_ids.
+    """
+    ids = []
+    for raw in request.args.get(name, "").split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            row_id = int(raw)
+        except ValueError as exc:
+            raise ValueError(f"{name} must be comma-separated integers") from exc
+        if row_id not in ids:
+            ids.append(row_id)
+    if len(ids) > max_ids:
+        raise ValueError(f"At most {max_ids} {name} per request")
+    return ids